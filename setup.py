@@ -26,14 +26,20 @@ setup(
     url="https://github.com/samapriya/source-coop",
     install_requires=[
         "requests>=2.25.0",
+        "urllib3>=1.26.0",
         "boto3>=1.17.0",
         "rich>=10.0.0",
-        "pandas>=1.0.0",
-        "pyarrow>=3.0.0",
-        "tqdm>=4.60.0",
+        "pyarrow>=7.0.0",
         "aiohttp>=3.8.0",
-        "aiofiles>=0.7.0",
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.0.0",
+            "uvloop>=0.14.0; sys_platform != 'win32'",
+            "winloop; sys_platform == 'win32'",
+        ],
+        "http2": ["httpx[http2]>=0.23.0"],
+    },
     license="Apache 2.0",
     long_description=open("README.md", "r", encoding="utf-8").read(),
     long_description_content_type="text/markdown",
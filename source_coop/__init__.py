@@ -2,13 +2,9 @@
 Source Coop CLI package - A Python client for Source Coop
 """
 
+import importlib
 import logging
 
-from source_coop.client import SourceCoopClient
-from source_coop.api import SourceCoopAPI
-from source_coop.s3 import SourceCoopS3
-from source_coop.auth import load_cookies, login_to_source_coop, save_cookies
-
 # Set up a null handler for the package's logger
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
@@ -18,8 +14,35 @@ __author__ = 'Source Coop Team'
 __all__ = [
     'SourceCoopClient',
     'SourceCoopAPI',
+    'AsyncSourceCoopAPI',
     'SourceCoopS3',
+    'S3Object',
     'load_cookies',
     'login_to_source_coop',
     'save_cookies',
 ]
+
+# Public names are imported on first access so that `import source_coop`
+# does not pull in boto3 and friends for commands that never use them
+_LAZY_ATTRS = {
+    'SourceCoopClient': 'source_coop.client',
+    'SourceCoopAPI': 'source_coop.api',
+    'AsyncSourceCoopAPI': 'source_coop.async_api',
+    'SourceCoopS3': 'source_coop.s3',
+    'S3Object': 'source_coop.s3',
+    'load_cookies': 'source_coop.auth',
+    'login_to_source_coop': 'source_coop.auth',
+    'save_cookies': 'source_coop.auth',
+}
+
+def __getattr__(name):
+    """Import public names lazily on first attribute access"""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include lazily imported names in dir() output"""
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
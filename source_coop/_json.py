@@ -0,0 +1,61 @@
+"""
+Copyright 2025 Samapriya Roy
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+JSON helpers that use orjson when it is installed
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads(data):
+    """
+    Parse a JSON document
+
+    Args:
+        data (bytes or str): JSON document
+
+    Returns:
+        object: Parsed document
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj, indent=False):
+    """
+    Serialize an object to UTF-8 encoded JSON
+
+    Args:
+        obj (object): Object to serialize
+        indent (bool): Whether to pretty-print with a two-space indent
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
@@ -0,0 +1,104 @@
+"""
+Copyright 2025 Samapriya Roy
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Console and plain-text table output shared by the commands
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+from rich.console import Console
+
+# Set to 1 to always write plain tab-separated tables, even on a terminal
+PLAIN_ENV_VAR = "SOURCE_COOP_PLAIN"
+
+@lru_cache(maxsize=2)
+def get_console(stderr=False):
+    """
+    Get the Rich console shared by every command and display function
+
+    Terminal capabilities are detected once per process rather than by
+    every Console() a command creates.
+
+    Args:
+        stderr (bool): Return the console writing to stderr instead of stdout
+
+    Returns:
+        Console: Shared console
+    """
+    return Console(stderr=stderr)
+
+def use_plain_output(console):
+    """
+    Check whether tables should be written as plain text instead of Rich tables
+
+    Args:
+        console (Console): Console the table would be printed on
+
+    Returns:
+        bool: True when SOURCE_COOP_PLAIN=1 is set or the console is neither
+            attached to a terminal nor running in Jupyter
+    """
+    # Rich reports is_terminal=False in Jupyter, which renders tables itself
+    return os.environ.get(PLAIN_ENV_VAR) == "1" or not (console.is_terminal or console.is_jupyter)
+
+def add_columns(table, columns):
+    """
+    Add columns to a Rich table
+
+    Args:
+        table (Table): Table to add the columns to
+        columns (tuple): (field, header, options) tuples, where options are
+            keyword arguments for Table.add_column
+    """
+    for _, header, options in columns:
+        table.add_column(header, **options)
+
+def column_fields(columns):
+    """
+    Get the field names of table columns, used as the plain-text header
+
+    Args:
+        columns (tuple): (field, header, options) tuples
+
+    Returns:
+        tuple: Field name of each column
+    """
+    return tuple(field for field, _, _ in columns)
+
+def _plain_cell(value):
+    """Render a cell on one line, since tabs and newlines would split it"""
+    if value is None:
+        return ""
+    return str(value).replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+def print_tsv(header, rows, file=None):
+    """
+    Write a header and rows as tab-separated lines in a single write
+
+    Plain tables are headed by field names (see column_fields) rather than
+    the display labels of the Rich tables, so scripts get stable names.
+
+    Args:
+        header (tuple): Column field names, or None to continue a table
+            with more rows
+        rows (iterable): Row tuples, one value per column
+        file (file, optional): Stream to write to (defaults to sys.stdout)
+    """
+    lines = ["\t".join(header)] if header is not None else []
+    lines.extend("\t".join([_plain_cell(value) for value in row]) for row in rows)
+    if lines:
+        (file or sys.stdout).write("\n".join(lines) + "\n")
@@ -13,32 +13,129 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 
-Source Coop download command implementation
+Source Coop API client
 """
 
 import logging
-import json
 import requests
-from pathlib import Path
-from urllib.parse import parse_qs, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from source_coop import _json
 
 logger = logging.getLogger("source-coop.api")
 
 class SourceCoopAPI:
     """API client for Source Coop"""
 
+    __slots__ = ("cookies", "_session")
+
     BASE_URL = "https://source.coop/api/v1"
     DATA_ENDPOINT = "https://data.source.coop"
 
-    def __init__(self, cookies=None):
+    # Full URLs for static endpoints, so paginated calls skip string formatting
+    _URLS = {
+        'whoami': BASE_URL + "/whoami",
+        'repositories': BASE_URL + "/repositories",
+        'repositories/featured': BASE_URL + "/repositories/featured",
+    }
+
+    # Built once at class creation instead of on every request
+    _DEFAULT_HEADERS = MappingProxyType({
+        'accept': '*/*',
+        'accept-language': 'en-US,en;q=0.9',
+        'dnt': '1',
+        'priority': 'u=1, i',
+        'referer': 'https://source.coop/',
+        'sec-ch-ua': '"Chromium";v="134", "Not:A-Brand";v="24", "Google Chrome";v="134"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': '"Windows"',
+        'sec-fetch-dest': 'empty',
+        'sec-fetch-mode': 'cors',
+        'sec-fetch-site': 'same-origin',
+        'sec-gpc': '1',
+        'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36',
+    })
+
+    def __init__(self, cookies=None, backend="requests"):
         """
         Initialize the API client
 
         Args:
             cookies (dict, optional): Cookies for authenticated requests
+            backend (str): HTTP backend, either "requests" or "httpx"
+                           ("httpx" speaks HTTP/2 and needs the http2 extra)
         """
         self.cookies = cookies or {}
 
+        # Reuse a single pooled session so keep-alive connections (and TLS
+        # handshakes) are shared across all API calls
+        if backend == "requests":
+            self._session = self._create_requests_session()
+        elif backend == "httpx":
+            self._session = self._create_httpx_client()
+        else:
+            raise ValueError(f"Unsupported HTTP backend: {backend}")
+
+    def _create_requests_session(self):
+        """
+        Create a pooled requests session with retries
+
+        Returns:
+            requests.Session: Session with default headers and cookies attached
+        """
+        session = requests.Session()
+        session.headers.update(self._DEFAULT_HEADERS)
+        session.cookies.update(self.cookies)
+
+        # Transient failures are retried by urllib3 on the pooled connection,
+        # honouring any Retry-After header sent with 429/503 responses
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _create_httpx_client(self):
+        """
+        Create an HTTP/2 capable httpx client
+
+        A single HTTP/2 connection can carry many concurrent requests, which
+        removes head-of-line blocking when several API calls are in flight.
+
+        Returns:
+            httpx.Client: Client with default headers and cookies attached
+        """
+        import httpx
+
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+        return httpx.Client(
+            transport=transport,
+            headers=dict(self._DEFAULT_HEADERS),
+            cookies=self.cookies,
+            # requests follows redirects by default but httpx does not
+            follow_redirects=True
+        )
+
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections
+        """
+        self._session.close()
+
     def get_default_headers(self):
         """
         Get default request headers for Source Coop API
@@ -46,21 +143,7 @@ class SourceCoopAPI:
         Returns:
             dict: Default headers
         """
-        return {
-            'accept': '*/*',
-            'accept-language': 'en-US,en;q=0.9',
-            'dnt': '1',
-            'priority': 'u=1, i',
-            'referer': 'https://source.coop/',
-            'sec-ch-ua': '"Chromium";v="134", "Not:A-Brand";v="24", "Google Chrome";v="134"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Windows"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'same-origin',
-            'sec-gpc': '1',
-            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36',
-        }
+        return dict(self._DEFAULT_HEADERS)
 
     def _make_request(self, method, endpoint, **kwargs):
         """
@@ -69,7 +152,8 @@ class SourceCoopAPI:
         Args:
             method (str): HTTP method
             endpoint (str): API endpoint
-            **kwargs: Additional arguments to pass to requests
+            **kwargs: Additional arguments to pass to the HTTP backend
+                      (headers are merged with the session defaults)
 
         Returns:
             dict: Response JSON if successful
@@ -77,31 +161,26 @@ class SourceCoopAPI:
         Raises:
             Exception: If request fails
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        headers = self.get_default_headers()
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.pop('headers'))
+        url = self._URLS.get(endpoint) or f"{self.BASE_URL}/{endpoint}"
+        kwargs.setdefault('timeout', 30)
 
         try:
-            response = requests.request(
-                method,
-                url,
-                headers=headers,
-                cookies=self.cookies,
-                **kwargs
-            )
-
-            # Raise exception for 4xx/5xx status codes
-            response.raise_for_status()
+            # Default headers and cookies are already attached to the session
+            response = self._session.request(method, url, **kwargs)
+        except Exception as e:
+            # requests and httpx raise different exception types
+            logger.error("API request failed: %s", e)
+            raise
 
-            if response.status_code in (200, 304):
-                return response.json()
-            return None
+        status = response.status_code
+        if status >= 400:
+            logger.error("API %s %s -> %d: %s", method, url, status, response.text[:500])
+            response.raise_for_status()
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {str(e)}")
-            raise
+        # 204 and 304 responses carry no body to decode
+        if 200 <= status < 300 and response.content:
+            return _json.loads(response.content)
+        return None
 
     def whoami(self):
         """
@@ -116,7 +195,7 @@ class SourceCoopAPI:
                 return data.get('account', {}).get('profile', {})
             return None
         except Exception as e:
-            logger.error(f"Error making whoami request: {str(e)}")
+            logger.error("Error making whoami request: %s", e)
             return None
 
     def get_repositories(self, featured=False, limit=10, next_page=None, search=None):
@@ -133,20 +212,93 @@ class SourceCoopAPI:
             dict: Repository data if successful, None otherwise
         """
         try:
-            params = {}
-            if not featured and limit:
-                params["limit"] = limit
-            if not featured and next_page:
-                params["next"] = next_page
-            if search:
-                params["search"] = search
-
+            params = self._repository_params(featured, limit, next_page, search)
             endpoint = 'repositories/featured' if featured else 'repositories'
-            return self._make_request('GET', endpoint, params=params)
+            return self._make_request('GET', endpoint, params=params or None)
         except Exception as e:
-            logger.error(f"Error listing repositories: {str(e)}")
+            logger.error("Error listing repositories: %s", e)
             return None
 
+    def iter_repository_pages(self, featured=False, limit=100, search=None, next_page=None):
+        """
+        Iterate over result pages of repositories
+
+        The next page is fetched in a background thread while the caller
+        processes the current one, so at most two pages are held at a time:
+        the one being yielded and the one being prefetched.
+
+        Args:
+            featured (bool): Whether to list featured repositories
+            limit (int): Number of repositories to request per page
+            search (str): Search query to filter repositories
+            next_page (str): Token of the page to start from
+
+        Yields:
+            list: Repository data of each page
+
+        Raises:
+            Exception: If fetching a page fails
+        """
+        endpoint = 'repositories/featured' if featured else 'repositories'
+
+        def fetch(token):
+            params = self._repository_params(featured, limit, token, search)
+            return self._make_request('GET', endpoint, params=params) or {}
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, next_page)
+            while future is not None:
+                data = future.result()
+
+                # Featured repositories are returned as a single page
+                token = None if featured else data.get('next')
+                future = executor.submit(fetch, token) if token else None
+
+                yield data.get('repositories', [])
+
+    def iter_repositories(self, featured=False, limit=100, search=None, next_page=None):
+        """
+        Iterate over repositories across all result pages
+
+        Pages are fetched as described in iter_repository_pages.
+
+        Args:
+            featured (bool): Whether to list featured repositories
+            limit (int): Number of repositories to request per page
+            search (str): Search query to filter repositories
+            next_page (str): Token of the page to start from
+
+        Yields:
+            dict: Repository data for each repository
+
+        Raises:
+            Exception: If fetching a page fails
+        """
+        for page in self.iter_repository_pages(featured, limit, search, next_page):
+            for repo in page:
+                yield repo
+
+    @staticmethod
+    def _repository_params(featured, limit, next_page, search):
+        """
+        Build query parameters for the repositories endpoints
+
+        Args:
+            featured (bool): Whether the featured endpoint is used
+            limit (int): Maximum number of repositories to return
+            next_page (str): Token for pagination
+            search (str): Search query to filter repositories
+
+        Returns:
+            dict: Query parameters
+        """
+        # The featured endpoint is not paginated, so only search applies
+        if featured:
+            candidates = (("search", search),)
+        else:
+            candidates = (("limit", limit), ("next", next_page), ("search", search))
+        return {key: value for key, value in candidates if value}
+
     def get_profile(self, uname):
         """
         Get profile information for a user or organization
@@ -160,7 +312,7 @@ class SourceCoopAPI:
         try:
             return self._make_request('GET', f'accounts/{uname}/profile')
         except Exception as e:
-            logger.error(f"Error getting profile: {str(e)}")
+            logger.error("Error getting profile: %s", e)
             return None
 
     def get_members(self, uname):
@@ -176,5 +328,5 @@ class SourceCoopAPI:
         try:
             return self._make_request('GET', f'accounts/{uname}/members')
         except Exception as e:
-            logger.error(f"Error getting members: {str(e)}")
+            logger.error("Error getting members: %s", e)
             return None
@@ -0,0 +1,204 @@
+"""
+Copyright 2025 Samapriya Roy
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Asynchronous Source Coop API client
+"""
+
+import asyncio
+import logging
+
+import aiohttp
+
+from source_coop import _json
+from source_coop.api import SourceCoopAPI
+
+logger = logging.getLogger("source-coop.async_api")
+
+class AsyncSourceCoopAPI:
+    """Asynchronous API client for Source Coop"""
+
+    BASE_URL = SourceCoopAPI.BASE_URL
+
+    def __init__(self, cookies=None, limit=100, timeout=30):
+        """
+        Initialize the asynchronous API client
+
+        The underlying aiohttp session is created on first use, inside the
+        running event loop, and shared by every request made by this client.
+
+        Args:
+            cookies (dict, optional): Cookies for authenticated requests
+            limit (int): Maximum number of simultaneous connections
+            timeout (int): Total timeout for each request in seconds
+        """
+        self.cookies = cookies or {}
+        self.limit = limit
+        self.timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        """
+        Get the shared aiohttp session, creating it if needed
+
+        Returns:
+            aiohttp.ClientSession: Session with keep-alive connection pooling
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=dict(SourceCoopAPI._DEFAULT_HEADERS),
+                cookies=self.cookies,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def close(self):
+        """
+        Close the underlying aiohttp session
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _make_request(self, method, endpoint, **kwargs):
+        """
+        Make a request to the API
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Returns:
+            dict: Response JSON if successful
+
+        Raises:
+            Exception: If request fails
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+        session = self._get_session()
+
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                status = response.status
+                body = await response.read()
+                if status >= 400:
+                    logger.error("API %s %s -> %d: %s", method, url, status,
+                                 body[:500].decode('utf-8', 'replace'))
+                    response.raise_for_status()
+
+                # 204 and 304 responses carry no body to decode
+                if 200 <= status < 300 and body:
+                    return _json.loads(body)
+                return None
+
+        except aiohttp.ClientResponseError:
+            # Already logged above along with the response body
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("API request failed: %s", e)
+            raise
+
+    async def whoami(self):
+        """
+        Get the currently logged-in user profile information
+
+        Returns:
+            dict: User profile data if successful, None otherwise
+        """
+        try:
+            data = await self._make_request('GET', 'whoami')
+            if data:
+                return data.get('account', {}).get('profile', {})
+            return None
+        except Exception as e:
+            logger.error("Error making whoami request: %s", e)
+            return None
+
+    async def get_repositories(self, featured=False, limit=10, next_page=None, search=None):
+        """
+        Get repositories from Source Coop
+
+        Args:
+            featured (bool): Whether to list featured repositories
+            limit (int): Maximum number of repositories to return
+            next_page (str): Token for pagination
+            search (str): Search query to filter repositories
+
+        Returns:
+            dict: Repository data if successful, None otherwise
+        """
+        try:
+            params = SourceCoopAPI._repository_params(featured, limit, next_page, search)
+            endpoint = 'repositories/featured' if featured else 'repositories'
+            return await self._make_request('GET', endpoint, params=params)
+        except Exception as e:
+            logger.error("Error listing repositories: %s", e)
+            return None
+
+    async def get_profile(self, uname):
+        """
+        Get profile information for a user or organization
+
+        Args:
+            uname (str): Username/account ID
+
+        Returns:
+            dict: Profile data if successful, None otherwise
+        """
+        try:
+            return await self._make_request('GET', f'accounts/{uname}/profile')
+        except Exception as e:
+            logger.error("Error getting profile: %s", e)
+            return None
+
+    async def get_members(self, uname):
+        """
+        Get members of an organization
+
+        Args:
+            uname (str): Organization username/account ID
+
+        Returns:
+            dict: Members data if successful, None otherwise
+        """
+        try:
+            return await self._make_request('GET', f'accounts/{uname}/members')
+        except Exception as e:
+            logger.error("Error getting members: %s", e)
+            return None
+
+    async def get_profiles(self, unames):
+        """
+        Get profile information for several users or organizations concurrently
+
+        Args:
+            unames (list): Usernames/account IDs
+
+        Returns:
+            list: Profile data for each username, None for failed lookups
+        """
+        return await asyncio.gather(*(self.get_profile(uname) for uname in unames))
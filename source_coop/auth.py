@@ -17,15 +17,25 @@ Source Coop download command implementation
 """
 
 import getpass
-import json
 import logging
+import re
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from source_coop import _json
 
 logger = logging.getLogger("source-coop.auth")
 
+# Cookies needed for authenticated requests (csrf token and session)
+_IMPORTANT_COOKIE = re.compile(r"csrf_token|ory_session")
+
+# Resolved once at import; Path.home() consults the environment/passwd database
+_CONFIG_DIR = Path.home() / ".config" / "source-coop"
+_COOKIE_PATH = _CONFIG_DIR / "cookies.json"
+
 def get_cookie_path():
     """
     Get the default path for cookies.json
@@ -33,8 +43,7 @@ def get_cookie_path():
     Returns:
         Path: Path object for the cookies.json file
     """
-    config_dir = Path.home() / ".config" / "source-coop"
-    return config_dir / "cookies.json"
+    return _COOKIE_PATH
 
 def load_cookies():
     """
@@ -47,29 +56,26 @@ def load_cookies():
     cookie_path = get_cookie_path()
 
     if not cookie_path.exists():
-        logger.info(f"Cookie file not found at {cookie_path}")
+        logger.info("Cookie file not found at %s", cookie_path)
         return {}
 
     try:
-        with open(cookie_path, 'r') as f:
-            all_cookies = json.load(f)
+        with open(cookie_path, 'rb') as f:
+            all_cookies = _json.loads(f.read())
 
         # Get the important cookies (csrf token and session)
         important_cookies = {}
-        count = 0
 
         for key, value in all_cookies.items():
-            if "csrf_token" in key or "ory_session" in key:
+            if _IMPORTANT_COOKIE.search(key):
                 important_cookies[key] = value
-                count += 1
+                if len(important_cookies) >= 2:
+                    break
 
-            if count >= 2:
-                break
-
-        logger.debug(f"Loaded {count} important cookies")
+        logger.debug("Loaded %s important cookies", len(important_cookies))
         return important_cookies
     except Exception as e:
-        logger.error(f"Error reading cookie file: {str(e)}")
+        logger.error("Error reading cookie file: %s", e)
         return {}
 
 def save_cookies(cookies, save_path=None):
@@ -90,12 +96,12 @@ def save_cookies(cookies, save_path=None):
     save_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(save_path, 'w') as f:
-            json.dump(cookies, f, indent=2)
-        logger.info(f"Cookies saved to {save_path}")
+        with open(save_path, 'wb') as f:
+            f.write(_json.dumps(cookies, indent=True))
+        logger.info("Cookies saved to %s", save_path)
         return True
     except Exception as e:
-        logger.error(f"Error saving cookies: {str(e)}")
+        logger.error("Error saving cookies: %s", e)
         return False
 
 def login_to_source_coop(email=None, password=None, save_path=None):
@@ -113,9 +119,8 @@ def login_to_source_coop(email=None, password=None, save_path=None):
     """
     # Set default path in user's config directory if not specified
     if save_path is None:
-        config_dir = Path.home() / ".config" / "source-coop"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        save_path = config_dir / "cookies.json"
+        _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        save_path = _COOKIE_PATH
 
     # Prompt for credentials if not provided
     if email is None:
@@ -130,10 +135,13 @@ def login_to_source_coop(email=None, password=None, save_path=None):
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
+        "Connection": "keep-alive",
     })
+    # All login round-trips go to the same host, so share one pooled connection
+    session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
     try:
-        response = session.get(f"{base_url}/self-service/login/browser")
+        response = session.get(f"{base_url}/self-service/login/browser", timeout=15)
         redirect_url = response.url
         parsed_url = urlparse(redirect_url)
         flow_id = parse_qs(parsed_url.query).get('flow', [None])[0]
@@ -143,41 +151,41 @@ def login_to_source_coop(email=None, password=None, save_path=None):
             return None
 
         login_flow_url = f"{base_url}/self-service/login/flows?id={flow_id}"
-        flow_response = session.get(login_flow_url)
+        flow_response = session.get(login_flow_url, timeout=15)
 
         if flow_response.status_code != 200:
-            logger.error(f"Failed to get login flow: {flow_response.status_code}")
+            logger.error("Failed to get login flow: %s", flow_response.status_code)
             return None
 
-        flow_data = flow_response.json()
+        flow_data = _json.loads(flow_response.content)
 
+        # Collect the CSRF token and credential fields in a single pass
+        login_data = {"method": "password"}
         csrf_token = None
-        for node in flow_data.get("ui", {}).get("nodes", []):
-            if node.get("attributes", {}).get("name") == "csrf_token":
-                csrf_token = node.get("attributes", {}).get("value")
-                break
+        nodes = flow_data.get("ui", {}).get("nodes", [])
+
+        for node in nodes:
+            attributes = node.get("attributes", {})
+            name = attributes.get("name", "")
+            if name == "csrf_token":
+                csrf_token = attributes.get("value")
+            elif name in ("identifier", "username", "email"):
+                login_data[name] = email
+            elif name == "password":
+                login_data[name] = password
 
         if not csrf_token:
             logger.error("CSRF token not found in login flow")
             return None
 
-        login_data = {
-            "csrf_token": csrf_token,
-            "method": "password",
-        }
-
-        for node in flow_data.get("ui", {}).get("nodes", []):
-            name = node.get("attributes", {}).get("name", "")
-            if name in ["identifier", "username", "email"]:
-                login_data[name] = email
-            elif name == "password":
-                login_data[name] = password
+        login_data["csrf_token"] = csrf_token
 
         login_url = f"{base_url}/self-service/login?flow={flow_id}"
         response = session.post(
             login_url,
             data=login_data,
-            allow_redirects=True
+            allow_redirects=True,
+            timeout=15
         )
 
         cookies = session.cookies.get_dict()
@@ -190,9 +198,9 @@ def login_to_source_coop(email=None, password=None, save_path=None):
         # Save cookies
         save_cookies(cookies, save_path)
 
-        logger.info(f"Login successful! Cookies saved to {save_path}")
+        logger.info("Login successful! Cookies saved to %s", save_path)
         return cookies
 
     except Exception as e:
-        logger.error(f"Login failed: {str(e)}")
+        logger.error("Login failed: %s", e)
         return None
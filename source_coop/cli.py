@@ -19,17 +19,10 @@ Source Coop download command implementation
 
 import argparse
 import logging
+import sys
 from pathlib import Path
 
-from source_coop.commands import (
-    login_command,
-    repos_command,
-    profile_command,
-    members_command,
-    summarize_command,
-    download_command,
-    whoami_command
-)
+from source_coop import commands
 
 # Configure logging
 logging.basicConfig(
@@ -41,6 +34,16 @@ logger = logging.getLogger("source-coop")
 
 def main():
     """Main entry point for the CLI"""
+    # Bare `whoami` and `login` take no flags, so dispatch them before
+    # building the full argument parser
+    argv = sys.argv[1:]
+    if argv == ["whoami"]:
+        commands.whoami_command()
+        return
+    if argv == ["login"]:
+        commands.login_command(None, None)
+        return
+
     parser = argparse.ArgumentParser(description="Source Coop CLI")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
@@ -62,6 +65,8 @@ def main():
     repos_optional.add_argument("--limit", type=int, default=10, help="Maximum number of repositories to return")
     repos_optional.add_argument("--next", help="Next page token for pagination")
     repos_optional.add_argument("--search", help="Search query to filter repositories")
+    repos_optional.add_argument("--all", action="store_true",
+                            help="Fetch all pages of results (--limit sets the page size); each page is displayed and exported as it arrives")
     repos_optional.add_argument("--export", choices=["json", "csv", "parquet"],
                             help="Export results to specified format")
     repos_optional.add_argument("--output", help="Path for exported file (default: ./exports/source-coop-repositories-<timestamp>.<format>)")
@@ -94,8 +99,8 @@ def main():
     download_required.add_argument("repository", help="Repository URL or S3 URL")
     download_optional.add_argument("--file-type", help="File type to filter by (e.g. '.csv')")
     download_optional.add_argument("--output-dir", help="Directory to save downloaded files (default: ./source-coop-<repo>)")
-    download_optional.add_argument("--threads", type=int, default=10,
-                               help="Maximum number of concurrent downloads (default: 10)")
+    download_optional.add_argument("--threads", type=int, default=32,
+                               help="Maximum number of concurrent HTTP requests (default: 32)")
     download_optional.add_argument("--multipart", type=int, default=8,
                                help="Number of parts to split large file downloads into (default: 8, 0 to disable)")
     download_optional.add_argument("--quiet", action="store_true",
@@ -105,21 +110,22 @@ def main():
 
     # Process commands
     if args.command == "login":
-        login_command(args.email, args.password)
+        commands.login_command(args.email, args.password)
     elif args.command == "whoami":
-        whoami_command()
+        commands.whoami_command()
     elif args.command == "repos":
-        repos_command(args.featured, args.limit, args.next, args.search,
-                     export_format=args.export, output_path=args.output)
+        commands.repos_command(args.featured, args.limit, args.next, args.search,
+                              export_format=args.export, output_path=args.output,
+                              all_pages=args.all)
     elif args.command == "profile":
-        profile_command(args.username)
+        commands.profile_command(args.username)
     elif args.command == "members":
-        members_command(args.organization)
+        commands.members_command(args.organization)
     elif args.command == "summarize":
-        summarize_command(args.repository, args.file_type)
+        commands.summarize_command(args.repository, args.file_type)
     elif args.command == "download":
-        download_command(args.repository, args.file_type, args.output_dir,
-                        args.threads, args.multipart, args.quiet)
+        commands.download_command(args.repository, args.file_type, args.output_dir,
+                                 args.threads, args.multipart, args.quiet)
     else:
         parser.print_help()
 
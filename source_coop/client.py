@@ -17,6 +17,7 @@ Source Coop download command implementation
 """
 
 import logging
+from functools import lru_cache
 
 from source_coop.api import SourceCoopAPI
 from source_coop.auth import load_cookies
@@ -27,6 +28,8 @@ logger = logging.getLogger("source-coop.client")
 class SourceCoopClient:
     """Main client for Source Coop integrating API and S3 functionality"""
 
+    __slots__ = ("cookies", "api", "_s3", "_async_api")
+
     def __init__(self, cookies=None):
         """
         Initialize the Source Coop client
@@ -41,8 +44,37 @@ class SourceCoopClient:
         # Initialize API client with cookies
         self.api = SourceCoopAPI(self.cookies)
 
-        # Initialize S3 client
-        self.s3 = SourceCoopS3()
+        # S3 client is created on first use, since building a boto3 client is
+        # expensive and most commands only talk to the API
+        self._s3 = None
+
+        # Async API client is created on first use
+        self._async_api = None
+
+    @property
+    def s3(self):
+        """
+        S3 client for repository data
+
+        Returns:
+            SourceCoopS3: S3 client, created on first access
+        """
+        if self._s3 is None:
+            self._s3 = SourceCoopS3()
+        return self._s3
+
+    @property
+    def async_api(self):
+        """
+        Asynchronous API client sharing this client's cookies
+
+        Returns:
+            AsyncSourceCoopAPI: Client backed by a single pooled aiohttp session
+        """
+        if self._async_api is None:
+            from source_coop.async_api import AsyncSourceCoopAPI
+            self._async_api = AsyncSourceCoopAPI(self.cookies)
+        return self._async_api
 
     def is_authenticated(self):
         """
@@ -52,7 +84,49 @@ class SourceCoopClient:
             bool: True if client has authentication cookies, False otherwise
         """
         # Check if we have both csrf_token and ory_session cookies
-        has_csrf = any("csrf_token" in key for key in self.cookies.keys())
-        has_session = any("ory_session" in key for key in self.cookies.keys())
+        # (load_cookies keeps at most these two, so this is a tiny scan)
+        keys = self.cookies.keys()
+        has_csrf = any(key.startswith("csrf_token") for key in keys)
+        has_session = any(key.startswith("ory_session") for key in keys)
 
         return has_csrf and has_session
+
+    def close(self):
+        """
+        Release network resources held by the client
+        """
+        self.api.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def aclose(self):
+        """
+        Release network resources held by the client, including the async session
+        """
+        self.close()
+        if self._async_api is not None:
+            await self._async_api.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Get the client shared by every command in this process
+
+    Commands reuse one client, so cookies are loaded and the lazily created
+    S3 and API clients are built once. login_command clears the cache after
+    a successful login so later commands pick up the new cookies.
+
+    Returns:
+        SourceCoopClient: Shared client
+    """
+    return SourceCoopClient()
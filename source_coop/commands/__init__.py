@@ -2,13 +2,7 @@
 Source Coop CLI commands package
 """
 
-from .login import login_command
-from .repos import repos_command
-from .profile import profile_command
-from .members import members_command
-from .summarize import summarize_command
-from .download import download_command
-from .whoami import whoami_command
+import importlib
 
 __all__ = [
     'login_command',
@@ -19,3 +13,27 @@ __all__ = [
     'download_command',
     'whoami_command',
 ]
+
+# Each command module is only imported when its command is requested, so a
+# single CLI invocation does not pay for the dependencies of every command
+_COMMANDS = {
+    'login_command': 'source_coop.commands.login',
+    'repos_command': 'source_coop.commands.repos',
+    'profile_command': 'source_coop.commands.profile',
+    'members_command': 'source_coop.commands.members',
+    'summarize_command': 'source_coop.commands.summarize',
+    'download_command': 'source_coop.commands.download',
+    'whoami_command': 'source_coop.commands.whoami',
+}
+
+def __getattr__(name):
+    """Import command functions lazily on first attribute access"""
+    if name not in _COMMANDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_COMMANDS[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include lazily imported names in dir() output"""
+    return sorted(list(globals()) + list(_COMMANDS))
@@ -16,13 +16,21 @@ limitations under the License.
 Source Coop download command implementation
 """
 
-
 import asyncio
 import logging
 import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from rich.console import Console
-from rich.prompt import Confirm
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
 from rich.progress import (
     BarColumn,
     DownloadColumn,
@@ -31,31 +39,214 @@ from rich.progress import (
     TimeRemainingColumn,
     TransferSpeedColumn
 )
-import aiohttp
-import aiofiles
-import requests
-from concurrent.futures import ThreadPoolExecutor
-from tqdm import tqdm
+from rich.prompt import Confirm
+from urllib3.util import Retry
+
+from source_coop._output import get_console
+from source_coop.client import get_client
+from source_coop.s3 import SourceCoopS3
+from .summarize import display_summary_table, display_objects_table
 
 logger = logging.getLogger("source-coop.commands.download")
 
-async def download_s3_objects_async(s3_objects, output_dir, max_concurrent=10, multipart_count=8, quiet=False):
+# Large userspace write buffer so chunk writes coalesce into few syscalls
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Threshold for multipart downloads (files larger than 10MB)
+MULTIPART_THRESHOLD = 10 * 1024 * 1024
+
+# Read size for response bodies; large chunks amortize per-chunk Python overhead
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Attempts per multipart part before giving up on the part
+PART_RETRIES = 5
+
+# Statuses a part request is retried on with backoff: throttling and
+# transient server errors
+RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Statuses that mean the server ignored or refused a byte range, so asking
+# for ranges again will not help
+RANGE_REJECTED_STATUSES = frozenset((200, 416))
+
+# Longest Retry-After delay honoured before retrying a part
+RETRY_AFTER_MAX = 60
+
+# Extra rounds in which only the failed parts of a file are fetched again
+# before the whole file is downloaded from scratch
+PART_RETRY_ROUNDS = 3
+
+# Suffix of the in-progress file that multipart downloads write into; it is
+# renamed into place once every part has arrived, so a full-size file on disk
+# always means a finished download
+PARTIAL_SUFFIX = ".part"
+
+# Progress bars are refreshed after this many bytes or seconds, whichever comes first
+PROGRESS_FLUSH_BYTES = 1024 * 1024
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+def allocate_file(path, size):
+    """
+    Create a file of the given size, reserving disk space where supported
+
+    Args:
+        path (Path): Path of the file to create (truncated if it exists)
+        size (int): Size of the file in bytes
+    """
+    with open(path, 'wb') as f:
+        f.truncate(size)
+        if hasattr(os, "posix_fallocate") and size > 0:
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                # Not all filesystems support fallocate; the sparse file still works
+                pass
+
+def interleave_by_size(s3_objects):
+    """
+    Order objects largest, smallest, second largest, second smallest, and so on
+
+    Starting the big files early while mixing in cheap ones keeps every
+    download slot busy instead of leaving a few large files running alone
+    at the end. The total size is accumulated in the same pass over the
+    objects that extracts the sort keys.
+
+    Args:
+        s3_objects (list): List of S3 objects with a 'size' field
+
+    Returns:
+        tuple: (objects in interleaved order, total size in bytes)
+    """
+    by_size = [(obj['size'], obj) for obj in s3_objects]
+    total_size = sum(map(itemgetter(0), by_size))
+    by_size.sort(key=itemgetter(0), reverse=True)
+
+    ordered = []
+    low, high = 0, len(by_size) - 1
+    while low <= high:
+        ordered.append(by_size[low][1])
+        if low != high:
+            ordered.append(by_size[high][1])
+        low += 1
+        high -= 1
+    return ordered, total_size
+
+def retry_delay(attempt, retry_after=None):
+    """
+    Get the number of seconds to wait before retrying a failed request
+
+    Args:
+        attempt (int): Zero-based number of the attempt that failed
+        retry_after (str, optional): Retry-After header of the failed response
+
+    Returns:
+        float: The server's Retry-After delay when given in seconds (capped at
+            RETRY_AFTER_MAX), otherwise jittered exponential backoff
+    """
+    if retry_after and retry_after.strip().isdigit():
+        return min(int(retry_after), RETRY_AFTER_MAX)
+    return min(2 ** attempt, 30) + random.random()
+
+def create_progress(console, disable=False):
+    """
+    Create the Rich progress display used for downloads
+
+    Args:
+        console (Console): Console to render the progress display on
+        disable (bool): If True, create the display without rendering anything
+
+    Returns:
+        Progress: Progress display with transfer size, speed and ETA columns
+    """
+    return Progress(
+        TextColumn("[bold blue]{task.description}", justify="right"),
+        BarColumn(bar_width=50),
+        "[progress.percentage]{task.percentage:>3.1f}%",
+        "•",
+        DownloadColumn(),
+        "•",
+        TransferSpeedColumn(),
+        "•",
+        TimeRemainingColumn(),
+        console=console,
+        expand=True,
+        disable=disable
+    )
+
+def local_file_size(path):
+    """
+    Get the size of a previously downloaded file
+
+    Args:
+        path (Path): Path of the local file
+
+    Returns:
+        int: Size of the file in bytes, or None if it does not exist
+    """
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+def resume_offset(path, obj, existing):
+    """
+    Get the offset an interrupted download of an object can resume from
+
+    A partial file is only continued when the listing has an ETag to send
+    as If-Range, so the server restarts the download if the object changed
+    since it was listed, and when the file was written after the object was
+    last modified, so a partial copy of an older version is not extended.
+
+    Args:
+        path (Path): Path of the local file
+        obj (S3Object): Object being downloaded
+        existing (int): Size of the local file, or None if it does not exist
+
+    Returns:
+        int: Byte offset to resume from, or 0 to download the whole object
+    """
+    if not existing or existing >= obj['size'] or not obj.get('etag'):
+        return 0
+
+    try:
+        written = path.stat().st_mtime
+    except OSError:
+        return 0
+
+    # Listed times are UTC with the offset dropped
+    modified = datetime.strptime(obj['last_modified'], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+    return existing if written >= modified.timestamp() else 0
+
+def create_parent_dirs(output_path, s3_objects):
+    """
+    Create the directories that downloaded objects will be written into
+
+    Args:
+        output_path (Path): Root download directory
+        s3_objects (list): List of S3 objects whose keys are relative paths
+    """
+    for parent in {(output_path / obj['key']).parent for obj in s3_objects}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+async def download_s3_objects_async(s3_objects, output_dir, max_concurrent=32, multipart_count=8, quiet=False,
+                                    s3_client=None):
     """
     Download S3 objects to a local directory using asynchronous requests with multipart support
 
     Args:
         s3_objects (list): List of S3 objects from list_s3_objects_with_summary
         output_dir (str): Directory to save downloaded files
-        max_concurrent (int): Maximum number of concurrent downloads
+        max_concurrent (int): Maximum number of concurrent HTTP requests
         multipart_count (int): Number of parts to split large file downloads into
         quiet (bool): If True, don't ask for confirmation
+        s3_client (SourceCoopS3, optional): S3 client used to transfer large files
+            with boto3's managed multipart downloads; aiohttp range requests are
+            used when not provided or when the transfer fails
 
     Returns:
         int: Number of successfully downloaded files
     """
-    from source_coop.s3 import SourceCoopS3
-
-    console = Console()
+    console = get_console()
 
     # Create output directory if it doesn't exist
     output_path = Path(output_dir)
@@ -67,8 +258,10 @@ async def download_s3_objects_async(s3_objects, output_dir, max_concurrent=10, m
         console.print("[yellow]No files to download[/yellow]")
         return 0
 
+    # Pair large files with small ones so no slot sits idle on a long tail
+    sorted_objects, total_size = interleave_by_size(s3_objects)
+
     # Confirm download if not in quiet mode
-    total_size = sum(obj['size'] for obj in s3_objects)
     download_prompt = f"Download {total_files} files ({SourceCoopS3.human_readable_size(total_size)}) to {output_dir}?"
 
     if not quiet and not Confirm.ask(download_prompt):
@@ -81,62 +274,66 @@ async def download_s3_objects_async(s3_objects, output_dir, max_concurrent=10, m
     else:
         console.print(f"[bold green]Downloading {total_files} files to {output_dir} using up to {max_concurrent} concurrent connections...[/bold green]")
 
-    # Sort objects by size (download larger files first)
-    sorted_objects = sorted(s3_objects, key=lambda x: x['size'], reverse=True)
+    # Create every destination directory once up front rather than per file
+    create_parent_dirs(output_path, sorted_objects)
 
     # Track successful downloads
     successful = 0
     failed = 0
+    skipped = 0
 
-    # Semaphore to limit concurrent downloads
+    # Semaphore to limit concurrent HTTP requests; every probe, part and
+    # single-stream download holds one slot, so multipart files share the
+    # same budget as small files
     semaphore = asyncio.Semaphore(max_concurrent)
 
-    # Setup progress display - using standard context manager (not async)
-    progress = Progress(
-        TextColumn("[bold blue]{task.description}", justify="right"),
-        BarColumn(bar_width=50),
-        "[progress.percentage]{task.percentage:>3.1f}%",
-        "•",
-        DownloadColumn(),
-        "•",
-        TransferSpeedColumn(),
-        "•",
-        TimeRemainingColumn(),
-        console=console,
-        expand=True
-    )
+    # Transfers take several slots; taking them one transfer at a time keeps
+    # two transfers from each holding part of what they need and waiting on
+    # each other forever
+    transfer_slots_lock = asyncio.Lock()
 
-    # Threshold for multipart downloads (files larger than 10MB)
-    MULTIPART_THRESHOLD = 10 * 1024 * 1024
+    # Setup progress display - using standard context manager (not async)
+    progress = create_progress(console)
 
     # Simplified multipart download approach
-    async def download_file_multipart(obj, task_id):
+    async def download_file_multipart(obj, task_id, session):
         file_key = obj['key']
         file_url = obj['download_url']
         file_size = obj['size']
 
-        # Create output path (preserve directory structure)
+        # Create output path (preserve directory structure); parts are written
+        # to a temporary file that replaces it once complete
         rel_path = file_key
         out_file = output_path / rel_path
+        part_file = out_file.with_name(out_file.name + PARTIAL_SUFFIX)
 
-        # Create parent directories if needed
-        out_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Try first with a HEAD request to check if the server supports Range
-        supports_range = False
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.head(file_url, timeout=30) as response:
-                    # Check if server supports range requests
-                    supports_range = "accept-ranges" in response.headers and response.headers["accept-ranges"] == "bytes"
-        except Exception:
-            # If HEAD fails, assume no range support
-            supports_range = False
+        # Probe range support with a one-byte ranged GET: a 206 confirms it and
+        # reports the total size in Content-Range, in a single round trip
+        first_byte = None
+        if multipart_count > 1:
+            try:
+                probe_headers = {'Range': 'bytes=0-0'}
+                probe_timeout = aiohttp.ClientTimeout(total=30)
+                async with semaphore:
+                    progress.update(task_id, visible=True)
+                    async with session.get(file_url, headers=probe_headers, timeout=probe_timeout) as response:
+                        if response.status == 206:
+                            # Content-Range: bytes 0-0/<total size>
+                            total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                            if total.isdigit():
+                                file_size = int(total)
+                            first_byte = await response.read()
+            except Exception:
+                # If the probe fails, assume no range support
+                first_byte = None
 
         # If server doesn't support range or we're forcing a single part download
-        if not supports_range or multipart_count <= 1:
+        if not first_byte or multipart_count <= 1:
             # Fallback to regular download
-            return await download_file_single(obj, task_id)
+            return await download_file_single(obj, task_id, session)
+
+        # The probe already fetched byte 0, so it is written first and not requested again
+        progress.update(task_id, total=file_size, advance=len(first_byte))
 
         # Calculate part boundaries
         part_size = file_size // multipart_count
@@ -145,93 +342,128 @@ async def download_s3_objects_async(s3_objects, output_dir, max_concurrent=10, m
             start_byte = i * part_size
             # Make sure the last part includes any remaining bytes
             end_byte = file_size - 1 if i == multipart_count - 1 else (i + 1) * part_size - 1
-            parts.append((start_byte, end_byte, i))
+            parts.append((start_byte + len(first_byte) if i == 0 else start_byte, end_byte, i))
 
-        # Create temporary part files
-        part_files = []
-        for _, _, i in parts:
-            part_file = output_path / f"{rel_path}.part{i}"
-            part_files.append(part_file)
+        # Pre-size the partial file so every part can write at its own offset,
+        # avoiding per-part files and a separate merge pass
+        try:
+            allocate_file(part_file, file_size)
+            with open(part_file, 'r+b') as f:
+                f.write(first_byte)
+        except OSError as e:
+            if not quiet:
+                console.print(f"[yellow]Could not pre-allocate {file_key} ({str(e)}), falling back to single download[/yellow]")
+            return await download_file_single(obj, task_id, session)
 
-        # Download each part
+        # Next byte to fetch for each part, so every retry (including later
+        # rounds) resumes from the last byte written by a failed attempt
+        positions = {part_num: start_byte for start_byte, _, part_num in parts}
+        range_rejected = False
+
+        # Download each part, retrying transient failures with jittered backoff
         async def download_part(start_byte, end_byte, part_num):
-            part_file = part_files[part_num]
+            nonlocal range_rejected
+            position = positions[part_num]
 
-            headers = {'Range': f'bytes={start_byte}-{end_byte}'}
+            for attempt in range(PART_RETRIES):
+                if position > end_byte:
+                    return True
 
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(file_url, headers=headers, timeout=60) as response:
-                        if response.status == 206:  # Partial Content
-                            # Create directory for part file if needed
-                            part_file.parent.mkdir(parents=True, exist_ok=True)
-
-                            # Write the part to a file
-                            async with aiofiles.open(part_file, 'wb') as f:
-                                downloaded = 0
-                                async for chunk in response.content.iter_chunked(64 * 1024):  # 64KB chunks
-                                    await f.write(chunk)
-                                    downloaded += len(chunk)
-                                    progress.update(task_id, advance=len(chunk))
-
-                            return True
-                        else:
-                            # Non-206 response means range request failed
-                            if not quiet:
-                                console.print(f"[yellow]Range request failed for part {part_num} with status {response.status}, falling back to single download[/yellow]")
-                            return False
-            except Exception as e:
-                if not quiet:
-                    console.print(f"[red]Error downloading part {part_num}: {str(e)}[/red]")
-                return False
+                headers = {'Range': f'bytes={position}-{end_byte}'}
+                retry_after = None
+
+                try:
+                    async with semaphore:
+                        progress.update(task_id, visible=True)
+                        async with session.get(file_url, headers=headers) as response:
+                            if response.status in RETRYABLE_STATUSES:
+                                # Throttled or a transient server error; back off below
+                                # and ask for the same range again
+                                retry_after = response.headers.get('Retry-After')
+                                error = f"HTTP {response.status}"
+                            elif response.status != 206:
+                                # Only a 200 or 416 means the server won't serve ranges;
+                                # any other status fails just this part
+                                if response.status in RANGE_REJECTED_STATUSES:
+                                    range_rejected = True
+                                if not quiet:
+                                    console.print(f"[yellow]Range request failed for part {part_num} with status {response.status}[/yellow]")
+                                return False
+                            else:
+                                # Write the part at its offset in the output file; buffered
+                                # writes are cheap enough to run directly on the loop
+                                with open(part_file, 'r+b', buffering=WRITE_BUFFER_SIZE) as f:
+                                    f.seek(position)
+                                    # Coalesce progress updates; each one takes Rich's lock
+                                    pending = 0
+                                    last_flush = time.monotonic()
+                                    try:
+                                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                            f.write(chunk)
+                                            position += len(chunk)
+                                            pending += len(chunk)
+                                            now = time.monotonic()
+                                            if pending >= PROGRESS_FLUSH_BYTES or now - last_flush >= PROGRESS_FLUSH_INTERVAL:
+                                                progress.update(task_id, advance=pending)
+                                                pending = 0
+                                                last_flush = now
+                                    finally:
+                                        # Bytes already written count even if the attempt fails
+                                        positions[part_num] = position
+                                        if pending:
+                                            progress.update(task_id, advance=pending)
+
+                                return True
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = str(e)
+                except Exception as e:
+                    if not quiet:
+                        console.print(f"[red]Error downloading part {part_num}: {str(e)}[/red]")
+                    return False
+
+                if attempt == PART_RETRIES - 1:
+                    if not quiet:
+                        console.print(f"[red]Error downloading part {part_num}: {error}[/red]")
+                    return False
+                # Wait outside the semaphore so the slot serves other requests
+                await asyncio.sleep(retry_delay(attempt, retry_after))
+
+            return False
 
         # Start downloading all parts
         part_results = await asyncio.gather(*[download_part(start, end, i) for start, end, i in parts])
+        failed_parts = [part for part, ok in zip(parts, part_results) if not ok]
+
+        # Fetch only the failed parts again, keeping the bytes that did arrive;
+        # a server that rejects ranges will not start accepting them
+        for _ in range(PART_RETRY_ROUNDS):
+            if not failed_parts or range_rejected:
+                break
+            part_results = await asyncio.gather(*[download_part(start, end, i) for start, end, i in failed_parts])
+            failed_parts = [part for part, ok in zip(failed_parts, part_results) if not ok]
 
         # Check if all parts downloaded successfully
-        if all(part_results):
-            try:
-                # Combine all parts into the final file
-                async with aiofiles.open(out_file, 'wb') as outfile:
-                    for part_file in part_files:
-                        if part_file.exists():
-                            async with aiofiles.open(part_file, 'rb') as infile:
-                                await outfile.write(await infile.read())
-
-                # Clean up part files
-                for part_file in part_files:
-                    try:
-                        if part_file.exists():
-                            part_file.unlink()
-                    except:
-                        pass
-
-                return True
-            except Exception as e:
-                if not quiet:
-                    console.print(f"[red]Error combining parts: {str(e)}[/red]")
-                return False
+        if not failed_parts:
+            os.replace(part_file, out_file)
+            return True
         else:
             # If any part failed, fall back to single download
             if not quiet:
                 console.print(f"[yellow]Some parts failed, falling back to single download for {file_key}[/yellow]")
 
-            # Clean up any part files
-            for part_file in part_files:
-                try:
-                    if part_file.exists():
-                        part_file.unlink()
-                except:
-                    pass
+            try:
+                part_file.unlink()
+            except OSError:
+                pass
 
             # Reset progress
             progress.update(task_id, completed=0)
 
             # Fall back to single download
-            return await download_file_single(obj, task_id)
+            return await download_file_single(obj, task_id, session)
 
-    # Standard single download
-    async def download_file_single(obj, task_id):
+    # Standard single download, resuming from `offset` bytes when the server honours ranges
+    async def download_file_single(obj, task_id, session, offset=0):
         file_key = obj['key']
         file_url = obj['download_url']
         file_size = obj['size']
@@ -240,24 +472,38 @@ async def download_s3_objects_async(s3_objects, output_dir, max_concurrent=10, m
         rel_path = file_key
         out_file = output_path / rel_path
 
-        # Create parent directories if needed
-        out_file.parent.mkdir(parents=True, exist_ok=True)
+        # If-Range makes the server send the whole object (200) instead of
+        # the rest of it (206) when it no longer matches the listed ETag
+        headers = {'Range': f'bytes={offset}-', 'If-Range': obj['etag']} if offset else None
 
         try:
-            # Start download with increased timeout
-            async with aiohttp.ClientSession() as session:
-                async with session.get(file_url, timeout=300) as response:  # 5 minute timeout
-                    if response.status == 200:
-                        # Open file for writing
-                        async with aiofiles.open(out_file, 'wb') as f:
-                            # Process the response body in chunks
-                            chunk_size = 128 * 1024  # 128KB chunks (larger for better performance)
-                            downloaded = 0
+            async with semaphore:
+                progress.update(task_id, visible=True)
+                async with session.get(file_url, headers=headers) as response:
+                    if response.status == 200 or (offset and response.status == 206):
+                        # A 206 continues the existing file; a 200 restarts it
+                        if response.status != 206:
+                            offset = 0
 
-                            async for chunk in response.content.iter_chunked(chunk_size):
-                                await f.write(chunk)
+                        # Open file for writing
+                        with open(out_file, 'ab' if offset else 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                            # Process the response body in chunks, refreshing the
+                            # progress bar only every PROGRESS_FLUSH_BYTES/INTERVAL
+                            downloaded = offset
+                            reported = offset
+                            progress.update(task_id, completed=offset)
+                            last_flush = time.monotonic()
+
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
                                 downloaded += len(chunk)
-                                progress.update(task_id, completed=downloaded)
+                                now = time.monotonic()
+                                if downloaded - reported >= PROGRESS_FLUSH_BYTES or now - last_flush >= PROGRESS_FLUSH_INTERVAL:
+                                    progress.update(task_id, completed=downloaded)
+                                    reported = downloaded
+                                    last_flush = now
+
+                            progress.update(task_id, completed=downloaded)
 
                         return True
                     else:
@@ -270,62 +516,134 @@ async def download_s3_objects_async(s3_objects, output_dir, max_concurrent=10, m
                 console.print(f"[red]Error downloading {file_key}: {str(e)}[/red]")
             return False
 
+    # Large file download through boto3's managed transfer (runs in a thread)
+    async def download_file_transfer(obj, task_id, session):
+        file_key = obj['key']
+        location = SourceCoopS3.parse_download_url(obj['download_url'])
+
+        # Presigned or non-S3 URLs can only be fetched over HTTP
+        if location is None:
+            return await download_file_multipart(obj, task_id, session)
+
+        out_file = output_path / file_key
+
+        # boto3 runs one range request per thread, so the transfer holds a
+        # slot for each of them
+        slots = min(multipart_count, max_concurrent)
+
+        def transfer():
+            s3_client.download_file(
+                location[0],
+                location[1],
+                out_file,
+                callback=lambda transferred: progress.update(task_id, advance=transferred),
+                max_concurrency=slots
+            )
+
+        acquired = 0
+        try:
+            try:
+                async with transfer_slots_lock:
+                    while acquired < slots:
+                        await semaphore.acquire()
+                        acquired += 1
+                progress.update(task_id, visible=True)
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(None, transfer)
+            finally:
+                for _ in range(acquired):
+                    semaphore.release()
+            return True
+        except Exception as e:
+            if not quiet:
+                console.print(f"[yellow]S3 transfer failed for {file_key} ({str(e)}), falling back to HTTP download[/yellow]")
+            progress.update(task_id, completed=0)
+            return await download_file_multipart(obj, task_id, session)
+
     # Main download coroutine - decide which method to use
-    async def download_file(obj):
-        nonlocal successful, failed
+    async def download_file(obj, session):
+        nonlocal successful, failed, skipped
 
         file_key = obj['key']
         file_size = obj['size']
 
-        # Use the semaphore to limit concurrent downloads
-        async with semaphore:
-            try:
-                # Create a progress bar for this file
-                task_id = progress.add_task(f"[cyan]{os.path.basename(file_key)}", total=file_size)
-
-                # Choose download method based on file size
-                # Only use multipart for larger files where it makes sense
-                use_multipart = multipart_count > 1 and file_size > MULTIPART_THRESHOLD
-
-                if use_multipart:
-                    result = await download_file_multipart(obj, task_id)
-                else:
-                    result = await download_file_single(obj, task_id)
-
-                if result:
-                    successful += 1
-                else:
-                    failed += 1
-                    try:
-                        progress.update(task_id, visible=False)
-                    except:
-                        pass
-
-            except Exception as e:
-                if not quiet:
-                    console.print(f"[red]Error downloading {file_key}: {str(e)}[/red]")
+        # A local file of the expected size is a finished earlier download;
+        # a shorter one was interrupted and is resumed where it stopped,
+        # unless the object may have changed since (see resume_offset)
+        existing = local_file_size(output_path / file_key)
+        if existing == file_size:
+            successful += 1
+            skipped += 1
+            return
+        offset = resume_offset(output_path / file_key, obj, existing)
+
+        try:
+            # Create a progress bar for this file; it is shown once the file's
+            # first request gets a slot
+            task_id = progress.add_task(f"[cyan]{os.path.basename(file_key)}", total=file_size, visible=False)
+
+            # Choose download method based on file size
+            # Only use multipart for larger files where it makes sense
+            use_multipart = multipart_count > 1 and file_size > MULTIPART_THRESHOLD
+
+            if offset:
+                result = await download_file_single(obj, task_id, session, offset=offset)
+            elif use_multipart and s3_client is not None:
+                result = await download_file_transfer(obj, task_id, session)
+            elif use_multipart:
+                result = await download_file_multipart(obj, task_id, session)
+            else:
+                result = await download_file_single(obj, task_id, session)
+
+            if result:
+                successful += 1
+            else:
                 failed += 1
+                try:
+                    progress.update(task_id, visible=False)
+                except:
+                    pass
 
-    # Create a list to hold the download tasks
-    download_tasks = []
+        except Exception as e:
+            if not quiet:
+                console.print(f"[red]Error downloading {file_key}: {str(e)}[/red]")
+            failed += 1
+
+    # One session (and connection pool) is shared by every file and part, so
+    # keep-alive connections and DNS lookups are reused across requests
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrent,
+        ttl_dns_cache=300,
+        keepalive_timeout=75
+    )
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=300)
 
     # Start the progress display
     with progress:
-        # Create a task for each object
-        for obj in sorted_objects:
-            download_tasks.append(download_file(obj))
-
-        # Run all downloads concurrently
-        await asyncio.gather(*download_tasks)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            # Keep only a bounded window of files in flight so task objects and
+            # progress bars are created as slots free up, not all at once
+            max_pending = max_concurrent * 2
+            pending = set()
+            for obj in sorted_objects:
+                if len(pending) >= max_pending:
+                    _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.add(asyncio.ensure_future(download_file(obj, session)))
+
+            # Wait for the remaining downloads
+            if pending:
+                await asyncio.wait(pending)
 
     # Final summary
     console.print(f"[bold green]Successfully downloaded {successful} of {total_files} files[/bold green]")
+    if skipped > 0:
+        console.print(f"[bold]Skipped {skipped} files already present in {output_dir}[/bold]")
     if failed > 0:
         console.print(f"[bold red]Failed to download {failed} files[/bold red]")
 
     return successful
 
-def download_s3_objects_sync(s3_objects, output_dir, quiet=False):
+def download_s3_objects_sync(s3_objects, output_dir, quiet=False, max_concurrent=32, multipart_count=8):
     """
     Fallback synchronous version for downloading S3 objects using ThreadPoolExecutor
 
@@ -333,13 +651,13 @@ def download_s3_objects_sync(s3_objects, output_dir, quiet=False):
         s3_objects (list): List of S3 objects from list_s3_objects_with_summary
         output_dir (str): Directory to save downloaded files
         quiet (bool): If True, don't ask for confirmation
+        max_concurrent (int): Maximum number of files downloaded at once
+        multipart_count (int): Number of byte ranges large files are split into
 
     Returns:
         int: Number of successfully downloaded files
     """
-    from source_coop.s3 import SourceCoopS3
-
-    console = Console()
+    console = get_console()
 
     # Create output directory if it doesn't exist
     output_path = Path(output_dir)
@@ -351,8 +669,10 @@ def download_s3_objects_sync(s3_objects, output_dir, quiet=False):
         console.print("[yellow]No files to download[/yellow]")
         return 0
 
+    # Pair large files with small ones so no slot sits idle on a long tail
+    sorted_objects, total_size = interleave_by_size(s3_objects)
+
     # Confirm download if not in quiet mode
-    total_size = sum(obj['size'] for obj in s3_objects)
     download_prompt = f"Download {total_files} files ({SourceCoopS3.human_readable_size(total_size)}) to {output_dir}?"
 
     if not quiet and not Confirm.ask(download_prompt):
@@ -362,77 +682,245 @@ def download_s3_objects_sync(s3_objects, output_dir, quiet=False):
     console.print(f"[bold yellow]Using synchronous download fallback with ThreadPoolExecutor[/bold yellow]")
     console.print(f"[bold green]Downloading {total_files} files to {output_dir}...[/bold green]")
 
-    # Sort objects by size (download larger files first)
-    sorted_objects = sorted(s3_objects, key=lambda x: x['size'], reverse=True)
+    # Create every destination directory once up front rather than per file
+    create_parent_dirs(output_path, sorted_objects)
+
+    # One aggregate progress bar for all files; Rich's Progress is thread-safe,
+    # so workers update it directly instead of each drawing its own bar
+    progress = create_progress(console, disable=quiet)
+    task_id = progress.add_task(f"[cyan]{total_files} files", total=total_size)
+
+    # Bytes each file has added to the bar, so a file that restarts from
+    # scratch can take its earlier progress back out
+    counted = {}
+    counted_lock = threading.Lock()
+
+    def advance(file_key, size):
+        with counted_lock:
+            counted[file_key] = counted.get(file_key, 0) + size
+        progress.update(task_id, advance=size)
+
+    def rewind(file_key):
+        with counted_lock:
+            size = counted.pop(file_key, 0)
+        if size:
+            progress.update(task_id, advance=-size)
+
+    # Write a response body to an open file, reporting progress as it arrives
+    def write_body(response, f, file_key):
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            if chunk:
+                f.write(chunk)
+                advance(file_key, len(chunk))
+
+    # Standard single download, resuming from `offset` bytes when the server honours ranges
+    def download_file_single(obj, offset=0):
+        file_key = obj['key']
+        out_file = output_path / file_key
 
-    # Track successful downloads
-    successful = 0
-    failed = 0
+        # If-Range makes the server send the whole object (200) instead of
+        # the rest of it (206) when it no longer matches the listed ETag
+        headers = {'Range': f'bytes={offset}-', 'If-Range': obj['etag']} if offset else None
 
-    # Define the download function
-    def download_file(obj):
-        nonlocal successful, failed
+        with session.get(obj['download_url'], headers=headers, stream=True, timeout=300) as response:  # Increased timeout
+            if response.status_code != 200 and not (offset and response.status_code == 206):
+                if not quiet:
+                    console.print(f"[red]Failed to download {file_key}: HTTP {response.status_code}[/red]")
+                return False
+
+            # A 206 continues the existing file; a 200 restarts it
+            if response.status_code != 206:
+                offset = 0
+            rewind(file_key)
+            advance(file_key, offset)
+
+            with open(out_file, 'ab' if offset else 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                write_body(response, f, file_key)
+
+        return True
 
+    # Split a large file into byte ranges fetched in parallel on the part pool,
+    # since one connection to S3 tops out well below the available bandwidth
+    def download_file_multipart(obj):
         file_key = obj['key']
         file_url = obj['download_url']
-        file_size = obj['size']
+        out_file = output_path / file_key
+        part_file = out_file.with_name(out_file.name + PARTIAL_SUFFIX)
 
-        # Create output path (preserve directory structure)
-        rel_path = file_key
-        out_file = output_path / rel_path
+        # Probe range support and the total size with a one-byte ranged GET.
+        # The body is streamed so that a server ignoring the range and sending
+        # the whole object is closed unread instead of loaded into memory
+        first_byte = None
+        try:
+            with session.get(file_url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=30) as response:
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                if response.status_code == 206 and total.isdigit():
+                    file_size = int(total)
+                    first_byte = response.content
+        except requests.RequestException:
+            first_byte = None
+
+        if not first_byte:
+            return download_file_single(obj)
+
+        # Parts are written into a pre-sized partial file that replaces the
+        # output file only once every part has arrived
+        try:
+            allocate_file(part_file, file_size)
+            with open(part_file, 'r+b') as f:
+                f.write(first_byte)
+        except OSError:
+            return download_file_single(obj)
+
+        advance(file_key, len(first_byte))
 
-        # Create parent directories if needed
-        out_file.parent.mkdir(parents=True, exist_ok=True)
+        # Next byte to fetch for each part; retries resume from it
+        positions = {}
+        range_rejected = False
+
+        def download_part(part_num, end_byte):
+            nonlocal range_rejected
+            headers = {'Range': f'bytes={positions[part_num]}-{end_byte}'}
+            try:
+                with session.get(file_url, headers=headers, stream=True, timeout=300) as response:
+                    if response.status_code != 206:
+                        # Only a 200 or 416 means the server won't serve ranges;
+                        # throttling and server errors were already retried by
+                        # the session, so anything else fails just this part
+                        if response.status_code in RANGE_REJECTED_STATUSES:
+                            range_rejected = True
+                        if not quiet:
+                            console.print(f"[yellow]Range request failed for part {part_num} of {file_key} with status {response.status_code}[/yellow]")
+                        return False
+                    with open(part_file, 'r+b', buffering=WRITE_BUFFER_SIZE) as f:
+                        f.seek(positions[part_num])
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            positions[part_num] += len(chunk)
+                            advance(file_key, len(chunk))
+            except requests.RequestException as e:
+                if not quiet:
+                    console.print(f"[yellow]Range download failed for part {part_num} of {file_key} ({str(e)})[/yellow]")
+                return False
+            return True
+
+        # Calculate part boundaries; the last part includes any remaining bytes
+        part_size = file_size // multipart_count
+        parts = []
+        for i in range(multipart_count):
+            positions[i] = len(first_byte) if i == 0 else i * part_size
+            parts.append((i, file_size - 1 if i == multipart_count - 1 else (i + 1) * part_size - 1))
+
+        # Fetch all parts, then only the failed ones for a few more rounds
+        # so the bytes that did arrive are kept
+        failed_parts = parts
+        for _ in range(1 + PART_RETRY_ROUNDS):
+            futures = [part_executor.submit(download_part, *part) for part in failed_parts]
+            failed_parts = [part for part, future in zip(failed_parts, futures) if not future.result()]
+            if not failed_parts or range_rejected:
+                break
+
+        if not failed_parts:
+            os.replace(part_file, out_file)
+            return True
 
         try:
-            # Download with progress bar for larger files
-            with requests.get(file_url, stream=True, timeout=300) as response:  # Increased timeout
-                if response.status_code == 200:
-                    if not quiet and file_size > 1024*10:  # Show progress bar for files > 10KB
-                        with tqdm(
-                            total=file_size,
-                            unit='B',
-                            unit_scale=True,
-                            unit_divisor=1024,
-                            desc=os.path.basename(file_key),
-                            ncols=100
-                        ) as progress_bar:
-                            with open(out_file, 'wb') as f:
-                                for chunk in response.iter_content(chunk_size=128*1024):  # Larger chunks
-                                    if chunk:
-                                        f.write(chunk)
-                                        progress_bar.update(len(chunk))
-                    else:
-                        with open(out_file, 'wb') as f:
-                            for chunk in response.iter_content(chunk_size=128*1024):
-                                if chunk:
-                                    f.write(chunk)
+            part_file.unlink()
+        except OSError:
+            pass
 
-                    successful += 1
-                    return True
-                else:
-                    if not quiet:
-                        console.print(f"[red]Failed to download {file_key}: HTTP {response.status_code}[/red]")
-                    failed += 1
-                    return False
+        if not quiet:
+            console.print(f"[yellow]Some parts failed, falling back to single download for {file_key}[/yellow]")
+        return download_file_single(obj)
+
+    # Download one file, returning 'skipped', 'downloaded' or 'failed'
+    def download_file(obj):
+        file_key = obj['key']
+        file_size = obj['size']
+
+        # A local file of the expected size is a finished earlier download;
+        # a shorter one was interrupted and is resumed where it stopped,
+        # unless the object may have changed since (see resume_offset)
+        existing = local_file_size(output_path / file_key)
+        if existing == file_size:
+            progress.update(task_id, advance=file_size)
+            return 'skipped'
+        offset = resume_offset(output_path / file_key, obj, existing)
+
+        use_multipart = multipart_count > 1 and file_size > MULTIPART_THRESHOLD
+
+        try:
+            if offset:
+                result = download_file_single(obj, offset=offset)
+            elif use_multipart:
+                result = download_file_multipart(obj)
+            else:
+                result = download_file_single(obj)
         except Exception as e:
             if not quiet:
                 console.print(f"[red]Error downloading {file_key}: {str(e)}[/red]")
-            failed += 1
-            return False
+            result = False
+        finally:
+            with counted_lock:
+                counted.pop(file_key, None)
+
+        return 'downloaded' if result else 'failed'
+
+    # Share one pooled session between the worker threads so connections are
+    # reused instead of paying a TLS handshake per file; the pool is sized for
+    # every file worker plus the range requests they fan out to. Range requests
+    # share one pool of max_concurrent workers, like the async request limit
+    part_workers = max_concurrent if multipart_count > 1 else 0
+    session = requests.Session()
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=RETRYABLE_STATUSES)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=max(20, max_concurrent + part_workers),
+        max_retries=retry
+    ))
+
+    # File workers wait on their parts, so parts run on a separate pool to
+    # avoid starving it
+    part_executor = ThreadPoolExecutor(max_workers=max(1, part_workers))
 
     # Use ThreadPoolExecutor for concurrent downloads
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        results = list(executor.map(download_file, sorted_objects))
+    with progress, session, part_executor, ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        outcomes = list(executor.map(download_file, sorted_objects))
+
+    # Tally outcomes here rather than with += from the worker threads
+    skipped = outcomes.count('skipped')
+    failed = outcomes.count('failed')
+    successful = total_files - failed
 
     # Final summary
     console.print(f"[bold green]Successfully downloaded {successful} of {total_files} files[/bold green]")
+    if skipped > 0:
+        console.print(f"[bold]Skipped {skipped} files already present in {output_dir}[/bold]")
     if failed > 0:
         console.print(f"[bold red]Failed to download {failed} files[/bold red]")
 
     return successful
 
-def download_s3_objects(s3_objects, output_dir, multipart_count=8, max_concurrent=10, quiet=False):
+def install_fast_event_loop():
+    """
+    Use uvloop (winloop on Windows) as the asyncio event loop when installed
+
+    Returns:
+        bool: True if a faster event loop policy was installed
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
+    logger.debug("Using %s event loop", fast_loop.__name__)
+    return True
+
+def download_s3_objects(s3_objects, output_dir, multipart_count=8, max_concurrent=32, quiet=False, s3_client=None):
     """
     Download S3 objects to a local directory (wrapper for async function)
 
@@ -440,12 +928,18 @@ def download_s3_objects(s3_objects, output_dir, multipart_count=8, max_concurren
         s3_objects (list): List of S3 objects from list_s3_objects_with_summary
         output_dir (str): Directory to save downloaded files
         multipart_count (int): Number of parts to split large file downloads into
-        max_concurrent (int): Maximum number of concurrent downloads
+        max_concurrent (int): Maximum number of concurrent HTTP requests
         quiet (bool): If True, don't ask for confirmation
+        s3_client (SourceCoopS3, optional): S3 client used to transfer large files
 
     Returns:
         int: Number of successfully downloaded files
     """
+    # The faster loop is only used for this download; the caller's event loop
+    # policy is put back afterwards
+    previous_policy = asyncio.get_event_loop_policy()
+    install_fast_event_loop()
+
     try:
         # Use asyncio.run() which creates a new event loop and closes it afterwards
         return asyncio.run(download_s3_objects_async(
@@ -453,21 +947,25 @@ def download_s3_objects(s3_objects, output_dir, multipart_count=8, max_concurren
             output_dir,
             max_concurrent=max_concurrent,
             multipart_count=multipart_count,
-            quiet=quiet
+            quiet=quiet,
+            s3_client=s3_client
         ))
     except RuntimeError as e:
         # Handle the case where we're in an environment that already has an event loop
         if "This event loop is already running" in str(e):
             logger.warning("Detected running event loop, falling back to synchronous downloads")
-            return download_s3_objects_sync(s3_objects, output_dir, quiet)
+            return download_s3_objects_sync(s3_objects, output_dir, quiet, max_concurrent=max_concurrent,
+                                            multipart_count=multipart_count)
         else:
-            logger.error(f"Runtime error during download: {str(e)}")
+            logger.error("Runtime error during download: %s", e)
             return 0
     except Exception as e:
-        logger.error(f"Error during download: {str(e)}")
+        logger.error("Error during download: %s", e)
         return 0
+    finally:
+        asyncio.set_event_loop_policy(previous_policy)
 
-def download_command(repository, file_type=None, output_dir=None, threads=10, multipart=8, quiet=False):
+def download_command(repository, file_type=None, output_dir=None, threads=32, multipart=8, quiet=False):
     """
     Download files from a repository
 
@@ -475,15 +973,12 @@ def download_command(repository, file_type=None, output_dir=None, threads=10, mu
         repository (str): Repository URL or S3 URL
         file_type (str, optional): File extension to filter by (e.g. '.csv')
         output_dir (str, optional): Directory to save downloaded files
-        threads (int): Number of concurrent download threads
+        threads (int): Maximum number of concurrent HTTP requests
         multipart (int): Number of parts to split large file downloads into (0 to disable)
         quiet (bool): If True, don't ask for confirmation and don't display object list
     """
-    from source_coop.client import SourceCoopClient
-    from source_coop.s3 import SourceCoopS3
-
-    console = Console()
-    client = SourceCoopClient()
+    console = get_console()
+    client = get_client()
     s3_client = client.s3
 
     # Convert repository URL to S3 URL if needed
@@ -511,12 +1006,12 @@ def download_command(repository, file_type=None, output_dir=None, threads=10, mu
 
     # Display summary if not quiet
     if not quiet:
-        from .summarize import display_summary_table, display_objects_table
         display_summary_table(summary)
         display_objects_table(objects)
 
     # Download the files
     if objects:
-        download_s3_objects(objects, output_dir, multipart_count=multipart, max_concurrent=threads, quiet=quiet)
+        download_s3_objects(objects, output_dir, multipart_count=multipart, max_concurrent=threads, quiet=quiet,
+                            s3_client=s3_client)
     else:
         console.print("[yellow]No files found to download[/yellow]")
@@ -19,7 +19,8 @@ Source Coop download command implementation
 import getpass
 import logging
 
-from source_coop.auth import save_cookies
+from source_coop.auth import login_to_source_coop, save_cookies
+from source_coop.client import get_client
 
 logger = logging.getLogger("source-coop.commands.login")
 
@@ -35,8 +36,6 @@ def login_command(email=None, password=None, save_path=None):
     Returns:
         dict: Session cookies if successful, None if failed
     """
-    from source_coop.auth import login_to_source_coop
-
     # Prompt for credentials if not provided
     if email is None:
         email = input("Email: ")
@@ -47,6 +46,8 @@ def login_command(email=None, password=None, save_path=None):
     cookies = login_to_source_coop(email, password, save_path)
 
     if cookies:
+        # Drop the shared client so it is rebuilt with the new cookies
+        get_client.cache_clear()
         logger.info("Login successful!")
         return cookies
     else:
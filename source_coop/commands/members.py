@@ -19,15 +19,30 @@ Source Coop download command implementation
 import logging
 
 from rich import box
-from rich.console import Console
 from rich.table import Table
 
+from source_coop._output import add_columns, column_fields, get_console, print_tsv, use_plain_output
+from source_coop.client import get_client
+
 logger = logging.getLogger("source-coop.commands.members")
 
+# Member field, column header and column options for each table column
+_MEMBER_COLUMNS = (
+    ("membership_id", "Membership ID", {"style": "cyan"}),
+    ("account_id", "Account ID", {"style": "green"}),
+    ("role", "Role", {"style": "yellow"}),
+    ("state", "State", {"style": "magenta"}),
+    ("membership_account_id", "Membership Account ID", {"style": "blue"}),
+    ("state_changed", "State Changed", {"style": "bright_cyan"}),
+)
+
 def display_members_table(members_data):
     """
     Display organization members in a nicely formatted table
 
+    When output is not a terminal, the rows are written as tab-separated
+    text instead.
+
     Args:
         members_data (list): List of member dictionaries
     """
@@ -35,28 +50,23 @@ def display_members_table(members_data):
         logger.info("No members data available")
         return
 
+    console = get_console()
+    fields = column_fields(_MEMBER_COLUMNS)
+    rows = [tuple(member.get(field, 'N/A') for field in fields) for member in members_data]
+
+    if use_plain_output(console):
+        print_tsv(fields, rows)
+        return
+
     # Create a rich table
-    console = Console()
     table = Table(show_header=True, header_style="bold blue", box=box.ROUNDED)
 
     # Add columns based on the data structure
-    table.add_column("Membership ID", style="cyan")
-    table.add_column("Account ID", style="green")
-    table.add_column("Role", style="yellow")
-    table.add_column("State", style="magenta")
-    table.add_column("Membership Account ID", style="blue")
-    table.add_column("State Changed", style="bright_cyan")
+    add_columns(table, _MEMBER_COLUMNS)
 
     # Add rows - using the correct structure
-    for member in members_data:
-        table.add_row(
-            member.get('membership_id', 'N/A'),
-            member.get('account_id', 'N/A'),
-            member.get('role', 'N/A'),
-            member.get('state', 'N/A'),
-            member.get('membership_account_id', 'N/A'),
-            member.get('state_changed', 'N/A')
-        )
+    for row in rows:
+        table.add_row(*row)
 
     # Print the table
     console.print(table)
@@ -71,10 +81,8 @@ def members_command(organization):
     Returns:
         list: Members data if successful, None otherwise
     """
-    from source_coop.client import SourceCoopClient
-
-    console = Console()
-    client = SourceCoopClient()
+    console = get_console()
+    client = get_client()
 
     # Get members data
     members_data = client.api.get_members(organization)
@@ -15,11 +15,12 @@ limitations under the License.
 
 Source Coop download command implementation
 """
-import json
-import logging
 
-from rich.console import Console
+import logging
 
+from source_coop import _json
+from source_coop._output import get_console
+from source_coop.client import get_client
 from .members import display_members_table
 
 logger = logging.getLogger("source-coop.commands.profile")
@@ -34,10 +35,8 @@ def profile_command(uname):
     Returns:
         dict: Profile data if successful, None otherwise
     """
-    from source_coop.client import SourceCoopClient
-
-    console = Console()
-    client = SourceCoopClient()
+    console = get_console()
+    client = get_client()
 
     # Get profile data
     profile_data = client.api.get_profile(uname)
@@ -49,7 +48,7 @@ def profile_command(uname):
     if profile_data.get('account_type') == 'user':
         # Display user profile
         console.print(f"\n[bold green]User Profile:[/bold green] {uname}")
-        console.print(json.dumps(profile_data, indent=2))
+        console.print(_json.dumps(profile_data, indent=True).decode('utf-8'))
     elif profile_data.get('account_type') == 'organization':
         # Display organization profile
         console.print(f"\n[bold green]Organization Profile:[/bold green] {uname}")
@@ -16,27 +16,95 @@ limitations under the License.
 Source Coop download command implementation
 """
 
-import csv
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
-import pandas as pd
 from rich import box
-from rich.console import Console
 from rich.table import Table
 
+from source_coop import _json
+from source_coop._output import add_columns, column_fields, get_console, print_tsv, use_plain_output
+from source_coop.client import get_client
+
 logger = logging.getLogger("source-coop.commands.repos")
 
-def display_repositories(data):
+# Buffer size for export files written from Python
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Rows collected before a batch is handed to the CSV or Parquet writer
+EXPORT_BATCH_ROWS = 10000
+
+# Supported export formats, which are also the file extensions
+_EXPORT_FORMATS = ('json', 'csv', 'parquet')
+
+# Field, header and column options of each displayed column, in the order
+# of _repository_row; titles and tags fold, dates get a fixed width
+_REPOSITORY_COLUMNS = (
+    ("repository_id", "Repository ID", {"style": "cyan", "no_wrap": True}),
+    ("title", "Title", {"style": "green", "overflow": "fold"}),
+    ("account_id", "Account", {"style": "blue", "no_wrap": True}),
+    ("tags", "Tags", {"style": "yellow", "overflow": "fold"}),
+    ("published", "Published", {"style": "magenta", "no_wrap": True, "width": 26}),
+    ("data_mode", "Data Mode", {"style": "red", "no_wrap": True, "width": 10}),
+    ("featured", "Featured", {"style": "bright_cyan", "no_wrap": True, "width": 8}),
+)
+
+# Column order of exported repositories, matching _export_row
+_EXPORT_FIELDS = (
+    'repository_id',
+    'account_id',
+    'title',
+    'description',
+    'tags',
+    'published',
+    'updated',
+    'data_mode',
+    'featured',
+)
+
+def _repository_row(repo):
     """
-    Display repository information in a nicely formatted table
+    Extract the displayed cells of a repository
 
     Args:
-        data (dict): Repository data from the API
+        repo (dict): Repository from the API
+
+    Returns:
+        tuple: Cells in the order of _REPOSITORY_COLUMNS
     """
-    console = Console()
+    meta = repo.get('meta') or {}
+
+    # Handle tags better - limit to first 3 and add ellipsis if more
+    tags_list = meta.get('tags') or []
+    tags = ", ".join(tags_list[:3]) + ("..." if len(tags_list) > 3 else "")
+
+    return (
+        repo.get('repository_id', 'N/A'),
+        meta.get('title', 'N/A'),
+        repo.get('account_id', 'N/A'),
+        tags,
+        repo.get('published', 'N/A'),
+        repo.get('data_mode', 'N/A'),
+        "Yes" if repo.get('featured') else "No"
+    )
+
+def _print_repositories(console, repositories, plain, header=True):
+    """
+    Print repositories as a Rich table, or as tab-separated text when plain
+
+    Args:
+        console (Console): Console to print the table on
+        repositories (list): Repository data from the API
+        plain (bool): Whether to write tab-separated text instead of a table
+        header (bool): Whether to write the header line of plain output
+    """
+    # Extract every row up front, then hand them to the table in one loop
+    rows = [_repository_row(repo) for repo in repositories]
+
+    if plain:
+        print_tsv(column_fields(_REPOSITORY_COLUMNS) if header else None, rows)
+        return
 
     # Create the table with improved layout for internationalization
     table = Table(
@@ -51,56 +119,231 @@ def display_repositories(data):
     )
 
     # Add columns with width constraints
-    table.add_column("Repository ID", style="cyan", no_wrap=True)
-    table.add_column("Title", style="green", overflow="fold")  # Will fold text properly
-    table.add_column("Account", style="blue", no_wrap=True)
-    table.add_column("Tags", style="yellow", overflow="fold")
-    table.add_column("Published", style="magenta", no_wrap=True, width=26)  # Fixed width for dates
-    table.add_column("Data Mode", style="red", no_wrap=True, width=10)
-    table.add_column("Featured", style="bright_cyan", no_wrap=True, width=8)
+    add_columns(table, _REPOSITORY_COLUMNS)
 
     # Add rows
-    for repo in data.get('repositories', []):
-        # Get the values, providing defaults if not present
-        repo_id = repo.get('repository_id', 'N/A')
-        title = repo.get('meta', {}).get('title', 'N/A')
-        account_id = repo.get('account_id', 'N/A')
-
-        # Handle tags better - limit to first 3 and add ellipsis if more
-        tags_list = repo.get('meta', {}).get('tags', [])
-        if len(tags_list) > 3:
-            tags = ", ".join(tags_list[:3]) + "..."
-        else:
-            tags = ", ".join(tags_list)
+    for row in rows:
+        table.add_row(*row)
 
-        published = repo.get('published', 'N/A')
-        data_mode = repo.get('data_mode', 'N/A')
-        featured = "Yes" if repo.get('featured') else "No"
+    # Print the table with a specific width that can accommodate CJK characters
+    console.print(table)
 
-        table.add_row(repo_id, title, account_id, tags, published, data_mode, featured)
+def _print_repository_count(console, plain, count, next_page=None):
+    """
+    Print the repository count and next page token, on stderr when plain
 
-    # Print additional information
-    console.print(f"\n[bold]Total count:[/bold] {data.get('count', 'N/A')}")
-    if 'next' in data:
-        console.print(f"[bold]Next page:[/bold] {data.get('next')}")
+    Args:
+        console (Console): Console used for Rich output
+        plain (bool): Whether tables are written as tab-separated text
+        count: Number of repositories
+        next_page (str, optional): Token of the next page
+    """
+    if plain:
+        stderr = get_console(stderr=True)
+        stderr.print(f"Total count: {count}", markup=False)
+        if next_page is not None:
+            stderr.print(f"Next page: {next_page}", markup=False)
+        return
 
-    # Print the table with a specific width that can accommodate CJK characters
-    console.print(table)
+    console.print(f"\n[bold]Total count:[/bold] {count}")
+    if next_page is not None:
+        console.print(f"[bold]Next page:[/bold] {next_page}")
 
-def export_repositories(data, export_format='json', output_path=None):
+def display_repositories(data):
     """
-    Export repository data to CSV, Parquet, or JSON format
+    Display repository information in a nicely formatted table
+
+    When output is not a terminal, the rows are written as tab-separated
+    text instead, with the count and next page token on stderr.
 
     Args:
         data (dict): Repository data from the API
+    """
+    console = get_console()
+    plain = use_plain_output(console)
+
+    # Print additional information
+    if not plain:
+        _print_repository_count(console, plain, data.get('count', 'N/A'), data.get('next'))
+
+    _print_repositories(console, data.get('repositories', []), plain)
+
+    if plain:
+        _print_repository_count(console, plain, data.get('count', 'N/A'), data.get('next'))
+
+def _export_value(value):
+    """
+    Convert an API value to the string stored in exports
+
+    Args:
+        value: Value from the API
+
+    Returns:
+        str: JSON text for lists and dicts, str() of other values, or None
+            for missing values
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, dict)):
+        return _json.dumps(value).decode('utf-8')
+    return str(value)
+
+def _export_row(repo):
+    """
+    Flatten a repository into a row of export values
+
+    Every value is a string or None, matching the string schema of CSV
+    and Parquet exports whatever type the API returns.
+
+    Args:
+        repo (dict): Repository from the API
+
+    Returns:
+        tuple: Values in the order of _EXPORT_FIELDS
+    """
+    meta = repo.get('meta') or {}
+    return (
+        _export_value(repo.get('repository_id')),
+        _export_value(repo.get('account_id')),
+        _export_value(meta.get('title')),
+        _export_value(meta.get('description')),
+        ','.join([_export_value(tag) for tag in meta.get('tags') or [] if tag is not None]),
+        _export_value(repo.get('published')),
+        _export_value(repo.get('updated')),
+        _export_value(repo.get('data_mode')),
+        'Yes' if repo.get('featured') else 'No'
+    )
+
+class _RepositoryExporter:
+    """
+    Export repositories to a JSON, CSV or Parquet file as they arrive
+
+    Repositories can be written in several batches, such as one per result
+    page, so at most EXPORT_BATCH_ROWS rows are held in memory however many
+    repositories are exported.
+    """
+
+    def __init__(self, export_format, file_path):
+        """
+        Create the export file and write its header
+
+        Args:
+            export_format (str): 'json', 'csv' or 'parquet'
+            file_path (Path): File to write
+        """
+        self.export_format = export_format
+        self.file_path = file_path
+        self.count = 0
+        self._file = None
+        self._writer = None
+        self._pending = []
+
+        if export_format == 'json':
+            # The envelope is written by hand so repositories can be streamed
+            # into it; the result matches dumping the whole envelope at once
+            self._exported_at = datetime.now().isoformat()
+            self._file = open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE)
+            self._file.write(b'{\n  "repositories": [\n')
+            return
+
+        # CSV and Parquet are written by pyarrow's C++ writers; pyarrow is
+        # imported here since JSON exports don't need it and it is slow to import
+        import pyarrow as pa
+
+        # Every exported field is a string, so the schema is known up front
+        self._schema = pa.schema([(field, pa.string()) for field in _EXPORT_FIELDS])
+        if export_format == 'csv':
+            import pyarrow.csv as pa_csv
+            self._writer = pa_csv.CSVWriter(str(file_path), self._schema)
+        else:
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(str(file_path), self._schema, compression='snappy', use_dictionary=True)
+
+    def write(self, repositories):
+        """
+        Add repositories to the export
+
+        Args:
+            repositories (list): Repository data from the API
+        """
+        if self._file is not None:
+            for repo in repositories:
+                if self.count:
+                    self._file.write(b',\n')
+                # Each repository sits two levels deep in the envelope
+                record = _json.dumps(dict(zip(_EXPORT_FIELDS, _export_row(repo))), indent=True)
+                self._file.write(b'    ' + record.replace(b'\n', b'\n    '))
+                self.count += 1
+            return
+
+        self._pending.extend(_export_row(repo) for repo in repositories)
+        self.count += len(repositories)
+        if len(self._pending) >= EXPORT_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        """
+        Write the pending rows to the Arrow writer as one table
+        """
+        if not self._pending:
+            return
+
+        import pyarrow as pa
+
+        # Transpose the rows into columns instead of inferring a type
+        # from every row
+        columns = list(zip(*self._pending))
+        self._writer.write_table(pa.Table.from_arrays(
+            [pa.array(column, type=pa.string()) for column in columns],
+            schema=self._schema
+        ))
+        self._pending = []
+
+    def close(self):
+        """
+        Write any remaining rows and the file footer, then close the file
+        """
+        if self._file is not None:
+            self._file.write(b'\n  ],\n  "count": %d,\n  "exported_at": ' % self.count)
+            self._file.write(_json.dumps(self._exported_at))
+            self._file.write(b'\n}')
+            self._file.close()
+        else:
+            self._flush()
+            self._writer.close()
+
+    def abort(self):
+        """
+        Close the export after a failure and remove the incomplete file
+        """
+        try:
+            if self._file is not None:
+                self._file.close()
+            elif self._writer is not None:
+                self._writer.close()
+        except Exception:
+            pass
+
+        try:
+            self.file_path.unlink()
+        except OSError:
+            pass
+
+def _open_exporter(repositories, export_format, output_path=None):
+    """
+    Choose the export file name and create an exporter for it
+
+    Args:
+        repositories (list): First repositories to be exported, used to name the file
         export_format (str): Format to export data to ('csv', 'parquet', or 'json')
         output_path (str, optional): Custom output path for the exported file
 
     Returns:
-        str: Path to the exported file if successful, None otherwise
+        _RepositoryExporter: Exporter if successful, None otherwise
     """
-    if not data or 'repositories' not in data or not data['repositories']:
-        logger.error("No repository data to export")
+    export_format = export_format.lower()
+    if export_format not in _EXPORT_FORMATS:
+        logger.error("Unsupported export format: %s", export_format)
         return None
 
     # Create output directory if needed
@@ -109,7 +352,7 @@ def export_repositories(data, export_format='json', output_path=None):
 
     # Generate default filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    featured_str = "featured-" if any(repo.get('featured') for repo in data['repositories']) else ""
+    featured_str = "featured-" if any(repo.get('featured') for repo in repositories) else ""
     default_filename = f"source-coop-{featured_str}repositories-{timestamp}"
 
     # Use provided output path or generate default path
@@ -121,60 +364,45 @@ def export_repositories(data, export_format='json', output_path=None):
     else:
         file_path = export_dir / default_filename
 
-    # Normalize repository data to flatten structure for export
-    repositories = []
-    for repo in data['repositories']:
-        flat_repo = {
-            'repository_id': repo.get('repository_id'),
-            'account_id': repo.get('account_id'),
-            'title': repo.get('meta', {}).get('title'),
-            'description': repo.get('meta', {}).get('description'),
-            'tags': ','.join(repo.get('meta', {}).get('tags', [])),
-            'published': repo.get('published'),
-            'updated': repo.get('updated'),
-            'data_mode': repo.get('data_mode'),
-            'featured': 'Yes' if repo.get('featured') else 'No'
-        }
-        repositories.append(flat_repo)
-
     try:
-        if export_format.lower() == 'json':
-            # Export to JSON
-            file_path = file_path.with_suffix('.json')
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'repositories': repositories,
-                    'count': len(repositories),
-                    'exported_at': datetime.now().isoformat()
-                }, f, indent=2, ensure_ascii=False)
-
-        elif export_format.lower() == 'csv':
-            # Export to CSV
-            file_path = file_path.with_suffix('.csv')
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                if repositories:
-                    writer = csv.DictWriter(f, fieldnames=repositories[0].keys())
-                    writer.writeheader()
-                    writer.writerows(repositories)
-
-        elif export_format.lower() == 'parquet':
-            # Export to Parquet (requires pandas and pyarrow)
-            file_path = file_path.with_suffix('.parquet')
-            df = pd.DataFrame(repositories)
-            df.to_parquet(file_path, index=False)
+        return _RepositoryExporter(export_format, file_path.with_suffix(f'.{export_format}'))
+    except Exception as e:
+        logger.error("Error exporting repositories: %s", e)
+        return None
 
-        else:
-            logger.error(f"Unsupported export format: {export_format}")
-            return None
+def export_repositories(data, export_format='json', output_path=None):
+    """
+    Export repository data to CSV, Parquet, or JSON format
+
+    Args:
+        data (dict): Repository data from the API
+        export_format (str): Format to export data to ('csv', 'parquet', or 'json')
+        output_path (str, optional): Custom output path for the exported file
+
+    Returns:
+        str: Path to the exported file if successful, None otherwise
+    """
+    if not data or 'repositories' not in data or not data['repositories']:
+        logger.error("No repository data to export")
+        return None
 
-        logger.info(f"Successfully exported repositories to {file_path}")
-        return str(file_path)
+    exporter = _open_exporter(data['repositories'], export_format, output_path)
+    if exporter is None:
+        return None
 
+    try:
+        exporter.write(data['repositories'])
+        exporter.close()
     except Exception as e:
-        logger.error(f"Error exporting repositories: {e}")
+        logger.error("Error exporting repositories: %s", e)
+        exporter.abort()
         return None
 
-def repos_command(featured=False, limit=10, next_page=None, search=None, display=True, export_format=None, output_path=None):
+    logger.info("Successfully exported repositories to %s", exporter.file_path)
+    return str(exporter.file_path)
+
+def repos_command(featured=False, limit=10, next_page=None, search=None, display=True, export_format=None, output_path=None,
+                  all_pages=False):
     """
     List repositories command implementation
 
@@ -186,14 +414,21 @@ def repos_command(featured=False, limit=10, next_page=None, search=None, display
         display (bool): Whether to display the repositories in a table
         export_format (str, optional): Format to export data ('csv', 'parquet', or 'json')
         output_path (str, optional): Custom output path for the exported file
+        all_pages (bool): Whether to follow pagination and fetch every page,
+                          using limit as the page size; each page is displayed
+                          and exported as it arrives
 
     Returns:
-        dict: Repository data if successful, None otherwise
+        dict: Repository data if successful, None otherwise; with all_pages,
+              only the total 'count' since the pages are not kept
     """
-    from source_coop.client import SourceCoopClient
+    console = get_console()
+    client = get_client()
 
-    console = Console()
-    client = SourceCoopClient()
+    # Every page is displayed and exported as it arrives rather than collected
+    if all_pages:
+        return _repos_all_pages(console, client, featured, limit, next_page, search, display,
+                                export_format, output_path)
 
     # Get repositories from API
     data = client.api.get_repositories(featured, limit, next_page, search)
@@ -213,3 +448,64 @@ def repos_command(featured=False, limit=10, next_page=None, search=None, display
             console.print(f"[bold green]Exported data to:[/bold green] {export_path}")
 
     return data
+
+def _repos_all_pages(console, client, featured, limit, next_page, search, display, export_format, output_path):
+    """
+    Display and export every page of repositories as it arrives
+
+    Args:
+        console (Console): Console to print on
+        client (SourceCoopClient): Client used to fetch the pages
+        featured (bool): Whether to list featured repositories
+        limit (int): Number of repositories per page
+        next_page (str): Token of the page to start from
+        search (str): Search query to filter repositories
+        display (bool): Whether to display the repositories
+        export_format (str, optional): Format to export data ('csv', 'parquet', or 'json')
+        output_path (str, optional): Custom output path for the exported file
+
+    Returns:
+        dict: Total 'count' of repositories if successful, None otherwise
+    """
+    plain = use_plain_output(console)
+    exporter = None
+    count = 0
+
+    try:
+        for page in client.api.iter_repository_pages(featured, limit, search, next_page):
+            if display:
+                # Plain output continues one table, so only the first page has a header
+                _print_repositories(console, page, plain, header=not count)
+
+            if export_format and page:
+                if exporter is None:
+                    exporter = _open_exporter(page, export_format, output_path)
+                    if exporter is None:
+                        export_format = None
+                if exporter is not None:
+                    exporter.write(page)
+
+            count += len(page)
+    except Exception as e:
+        logger.error("Error listing repositories: %s", e)
+        if exporter is not None:
+            exporter.abort()
+        console.print("[red]Error fetching repositories.[/red]")
+        return None
+
+    if display:
+        _print_repository_count(console, plain, count)
+
+    if exporter is not None:
+        try:
+            exporter.close()
+        except Exception as e:
+            logger.error("Error exporting repositories: %s", e)
+            exporter.abort()
+        else:
+            logger.info("Successfully exported repositories to %s", exporter.file_path)
+            console.print(f"[bold green]Exported data to:[/bold green] {exporter.file_path}")
+    elif export_format:
+        logger.error("No repository data to export")
+
+    return {'count': count}
@@ -16,23 +16,82 @@ limitations under the License.
 Source Coop download command implementation
 """
 
+import heapq
 import logging
-from rich.console import Console
-from rich.table import Table
+import sys
+from operator import attrgetter, itemgetter
+
 from rich import box
+from rich.table import Table
+
+from source_coop._output import add_columns, column_fields, get_console, print_tsv, use_plain_output
+from source_coop.client import get_client
+from source_coop.s3 import SourceCoopS3
 
 logger = logging.getLogger("source-coop.commands.summarize")
 
+# Field, header and column options of each table column
+_SUMMARY_COLUMNS = (
+    ("metric", "Metric", {"style": "cyan"}),
+    ("value", "Value", {"style": "green"}),
+)
+_FILE_TYPE_COLUMNS = (
+    ("extension", "Extension", {"style": "cyan"}),
+    ("count", "Count", {"style": "green", "justify": "right"}),
+    ("size", "Size", {"style": "yellow", "justify": "right"}),
+    ("percentage", "Percentage", {"style": "magenta", "justify": "right"}),
+)
+_OBJECT_COLUMNS = (
+    ("last_modified", "Last Modified", {"style": "cyan", "no_wrap": True}),
+    ("size", "Size", {"style": "green", "justify": "right"}),
+    ("key", "Key", {"style": "yellow", "overflow": "fold"}),
+)
+
+# Summary field and row label of each summary metric
+_SUMMARY_METRICS = (
+    ("total_files", "Total Files"),
+    ("total_size_human", "Total Size"),
+)
+
 def display_summary_table(summary):
     """
     Display a table with summary statistics
 
+    When output is not a terminal, both tables are written as tab-separated
+    text instead, separated by a blank line.
+
     Args:
         summary (dict): Summary statistics from list_s3_objects_with_summary
     """
-    from source_coop.s3 import SourceCoopS3  # Add this import here
+    console = get_console()
 
-    console = Console()
+    # Sort file types by size (descending)
+    sorted_types = sorted(
+        [(ext, stats['count'], stats['size']) for ext, stats in summary['file_types'].items()],
+        key=itemgetter(2),
+        reverse=True
+    )
+
+    # Percentage of the total size per byte, so each row is a single multiply
+    total_size = summary['total_size']
+    scale = 100 / total_size if total_size > 0 else 0
+
+    type_rows = [
+        (
+            ext,
+            str(count),
+            summary['total_size_human'] if ext == 'total' else SourceCoopS3.human_readable_size(size),
+            f"{size * scale:.2f}%"
+        )
+        for ext, count, size in sorted_types
+    ]
+
+    if use_plain_output(console):
+        print_tsv(column_fields(_SUMMARY_COLUMNS), [(field, summary[field]) for field, _ in _SUMMARY_METRICS])
+        if type_rows:
+            sys.stdout.write("\n")
+            print_tsv(column_fields(_FILE_TYPE_COLUMNS), type_rows)
+        return
 
     # Create the main summary table
     main_table = Table(
@@ -42,16 +101,15 @@ def display_summary_table(summary):
         box=box.ROUNDED
     )
 
-    main_table.add_column("Metric", style="cyan")
-    main_table.add_column("Value", style="green")
+    add_columns(main_table, _SUMMARY_COLUMNS)
 
-    main_table.add_row("Total Files", str(summary['total_files']))
-    main_table.add_row("Total Size", summary['total_size_human'])
+    for field, label in _SUMMARY_METRICS:
+        main_table.add_row(label, str(summary[field]))
 
     console.print(main_table)
 
     # Create the file types table
-    if summary['file_types']:
+    if type_rows:
         types_table = Table(
             title="File Types Breakdown",
             show_header=True,
@@ -59,26 +117,10 @@ def display_summary_table(summary):
             box=box.ROUNDED
         )
 
-        types_table.add_column("Extension", style="cyan")
-        types_table.add_column("Count", style="green", justify="right")
-        types_table.add_column("Size", style="yellow", justify="right")
-        types_table.add_column("Percentage", style="magenta", justify="right")
+        add_columns(types_table, _FILE_TYPE_COLUMNS)
 
-        # Sort file types by size (descending)
-        sorted_types = sorted(
-            summary['file_types'].items(),
-            key=lambda x: x[1]['size'],
-            reverse=True
-        )
-
-        for ext, stats in sorted_types:
-            percentage = (stats['size'] / summary['total_size'] * 100) if summary['total_size'] > 0 else 0
-            types_table.add_row(
-                ext,
-                str(stats['count']),
-                summary['total_size_human'] if ext == 'total' else SourceCoopS3.human_readable_size(stats['size']),
-                f"{percentage:.2f}%"
-            )
+        for row in type_rows:
+            types_table.add_row(*row)
 
         console.print(types_table)
 
@@ -86,18 +128,33 @@ def display_objects_table(s3_objects, limit=20):
     """
     Display a table with S3 objects
 
+    When output is not a terminal, the rows are written as tab-separated
+    text instead.
+
     Args:
         s3_objects (list): List of S3 objects from list_s3_objects_with_summary
         limit (int): Maximum number of objects to display
     """
-    from source_coop.s3 import SourceCoopS3  # Add this import here
-
-    console = Console()
+    console = get_console()
 
     if not s3_objects:
         console.print("[yellow]No objects found[/yellow]")
         return
 
+    # Pick the newest objects (limited to specified number) without sorting
+    # the whole listing; ties keep their listing order, as with sorted()
+    newest_objects = heapq.nlargest(limit, s3_objects, key=attrgetter('last_modified'))
+
+    # Extract rows before building any table
+    rows = [
+        (obj.last_modified, SourceCoopS3.human_readable_size(obj.size), obj.key)
+        for obj in newest_objects
+    ]
+
+    if use_plain_output(console):
+        print_tsv(column_fields(_OBJECT_COLUMNS), rows)
+        return
+
     # Create the table
     objects_table = Table(
         title=f"Objects (showing {min(limit, len(s3_objects))} of {len(s3_objects)})",
@@ -106,24 +163,10 @@ def display_objects_table(s3_objects, limit=20):
         box=box.ROUNDED
     )
 
-    objects_table.add_column("Last Modified", style="cyan", no_wrap=True)
-    objects_table.add_column("Size", style="green", justify="right")
-    objects_table.add_column("Key", style="yellow", overflow="fold")
-
-    # Sort by last modified (newest first)
-    sorted_objects = sorted(
-        s3_objects,
-        key=lambda x: x['last_modified'],
-        reverse=True
-    )
+    add_columns(objects_table, _OBJECT_COLUMNS)
 
-    # Add rows (limited to specified number)
-    for obj in sorted_objects[:limit]:
-        objects_table.add_row(
-            obj['last_modified'],
-            SourceCoopS3.human_readable_size(obj['size']),
-            obj['key']
-        )
+    for row in rows:
+        objects_table.add_row(*row)
 
     console.print(objects_table)
 
@@ -135,11 +178,8 @@ def summarize_command(repository, file_type=None):
         repository (str): Repository URL or S3 URL
         file_type (str, optional): File extension to filter by (e.g. '.csv')
     """
-    from source_coop.client import SourceCoopClient
-    from source_coop.s3 import SourceCoopS3
-
-    console = Console()
-    client = SourceCoopClient()
+    console = get_console()
+    client = get_client()
     s3_client = client.s3
 
     # Convert repository URL to S3 URL if needed
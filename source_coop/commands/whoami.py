@@ -18,7 +18,8 @@ Source Coop download command implementation
 
 import logging
 
-from rich.console import Console
+from source_coop._output import get_console
+from source_coop.client import get_client
 
 logger = logging.getLogger("source-coop.commands.whoami")
 
@@ -29,10 +30,8 @@ def whoami_command():
     Returns:
         dict: User profile data if successful, None otherwise
     """
-    from source_coop.client import SourceCoopClient
-
-    console = Console()
-    client = SourceCoopClient()
+    console = get_console()
+    client = get_client()
 
     if not client.is_authenticated():
         console.print("[yellow]Not logged in. Use 'login' command first.[/yellow]")
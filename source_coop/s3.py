@@ -19,20 +19,113 @@ Source Coop download command implementation
 import logging
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from urllib.parse import urlparse
 
-import boto3
-import botocore.exceptions
-from botocore.config import Config
-
 logger = logging.getLogger("source-coop.s3")
 
+# Repository URL schemes whose path can be found without urlparse
+_REPO_URL_SCHEMES = ('https://', 'http://')
+
+# Characters that make a repository URL need urlparse to find its path
+_REPO_URL_SPECIAL_CHARS = '?#;\t\r\n'
+
+@lru_cache(maxsize=8192)
+def _human_readable_size(size_bytes):
+    """
+    Format a size in bytes, memoized since listings repeat the same sizes often
+
+    Args:
+        size_bytes (int): Size in bytes
+
+    Returns:
+        str: Human-readable size (e.g., '1.23 GB')
+    """
+    if size_bytes == 0:
+        return "0 B"
+
+    size_names = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    # directly; sizes below one byte have a bit length of 0 and stay in bytes
+    i = max(0, min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1))
+
+    return f"{size_bytes / (1 << (i * 10)):.2f} {size_names[i]}"
+
+class S3Object:
+    """
+    An object returned by SourceCoopS3.list_objects
+
+    Fields are stored in slots rather than a per-object dict, which keeps
+    large listings small. They can also be read by name (obj['size']),
+    so code written against the dictionaries list_objects used to return
+    keeps working.
+    """
+
+    __slots__ = ('last_modified', 'size', 'key', 'extension', 'etag', '_base_url')
+
+    # Names readable with obj[name], in the order of the old dictionaries
+    FIELDS = ('last_modified', 'size', 'key', 'download_url', 'extension', 'etag')
+
+    def __init__(self, last_modified, size, key, extension, base_url, etag=None):
+        """
+        Args:
+            last_modified (str): Last modified time ('%Y-%m-%d %H:%M:%S')
+            size (int): Size in bytes
+            key (str): Object key
+            extension (str): Lower-cased file extension, or '' if there is none
+            base_url (str): Endpoint and bucket the key is appended to for
+                download_url; shared by every object of a listing
+            etag (str, optional): Quoted entity tag of the object, as listed
+        """
+        self.last_modified = last_modified
+        self.size = size
+        self.key = key
+        self.extension = extension
+        self.etag = etag
+        self._base_url = base_url
+
+    @property
+    def download_url(self):
+        """Direct download URL, built on access instead of stored per object"""
+        return f"{self._base_url}/{self.key}"
+
+    def __getitem__(self, name):
+        if name not in self.FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def get(self, name, default=None):
+        """Return a field by name, or default if there is no such field"""
+        return getattr(self, name) if name in self.FIELDS else default
+
+    def keys(self):
+        """Return the field names, so dict(obj) works"""
+        return self.FIELDS
+
+    def __eq__(self, other):
+        if not isinstance(other, S3Object):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"S3Object(key={self.key!r}, size={self.size!r}, last_modified={self.last_modified!r})"
+
 class SourceCoopS3:
     """S3 client for Source Coop"""
 
     ENDPOINT_URL = "https://data.source.coop"
 
+    # Number of prefixes listed concurrently by list_objects
+    LIST_MAX_WORKERS = 16
+
+    # Keys requested per list_objects_v2 page (the S3 maximum)
+    LIST_PAGE_SIZE = 1000
+
     def __init__(self, config=None):
         """
         Initialize the S3 client
@@ -40,13 +133,19 @@ class SourceCoopS3:
         Args:
             config (botocore.config.Config, optional): Custom boto3 configuration
         """
+        # boto3 is slow to import, so defer it until an S3 client is needed
+        import boto3
+        from botocore.config import Config
+
         # Use provided config or create a default one with retries
         self.config = config or Config(
             retries={
                 'max_attempts': 5,
                 'mode': 'standard'  # Uses exponential backoff
             },
-            s3={'addressing_style': 'path'}
+            s3={'addressing_style': 'path'},
+            # Room for concurrent listing threads and transfer parts
+            max_pool_connections=self.LIST_MAX_WORKERS * 2
         )
 
         # Create the S3 client
@@ -70,16 +169,7 @@ class SourceCoopS3:
         Returns:
             str: Human-readable size (e.g., '1.23 GB')
         """
-        if size_bytes == 0:
-            return "0 B"
-
-        size_names = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-
-        return f"{size_bytes:.2f} {size_names[i]}"
+        return _human_readable_size(size_bytes)
 
     @staticmethod
     def parse_s3_url(s3_url):
@@ -100,6 +190,50 @@ class SourceCoopS3:
         prefix = parts[1] if len(parts) > 1 else ''
         return bucket, prefix
 
+    @classmethod
+    def parse_download_url(cls, download_url):
+        """
+        Split a direct download URL from list_objects into bucket and key
+
+        Args:
+            download_url (str): URL in the format https://data.source.coop/bucket/key
+
+        Returns:
+            tuple: (bucket, key), or None if the URL is not served by the S3 endpoint
+        """
+        prefix = f"{cls.ENDPOINT_URL}/"
+        if not download_url.startswith(prefix):
+            return None
+
+        bucket, _, key = download_url[len(prefix):].partition('/')
+        if not bucket or not key:
+            return None
+        return bucket, key
+
+    @staticmethod
+    def _repo_url_path(repo_url):
+        """
+        Extract the path of a repository URL
+
+        Plain http(s) URLs are split at the first slash after the host;
+        anything with a query, fragment, parameters or characters that
+        urlparse would strip is handed to urlparse instead.
+
+        Args:
+            repo_url (str): Repository URL
+
+        Returns:
+            str: URL path, starting with '/' unless it is empty
+        """
+        for scheme in _REPO_URL_SCHEMES:
+            if repo_url.startswith(scheme):
+                rest = repo_url[len(scheme):]
+                if not any(char in rest for char in _REPO_URL_SPECIAL_CHARS):
+                    _, sep, path = rest.partition('/')
+                    return sep + path
+                break
+        return urlparse(repo_url).path
+
     @staticmethod
     def convert_repo_url_to_s3_url(repo_url):
         """
@@ -113,11 +247,8 @@ class SourceCoopS3:
             str: S3 URL in the format s3://account/repository
         """
         try:
-            # Parse the URL
-            parsed_url = urlparse(repo_url)
-
             # Extract the path
-            path = parsed_url.path
+            path = SourceCoopS3._repo_url_path(repo_url)
 
             # Remove /repositories/ prefix if present
             if '/repositories/' in path:
@@ -139,65 +270,223 @@ class SourceCoopS3:
                 return None
 
         except Exception as e:
-            logger.error(f"Error converting repository URL to S3 URL: {e}")
+            logger.error("Error converting repository URL to S3 URL: %s", e)
             return None
 
-    def list_objects(self, s3_url, file_type=None):
+    def download_file(self, bucket, key, filename, callback=None, max_concurrency=10,
+                      multipart_threshold=10 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024):
         """
-        List objects from an S3-compatible storage
-        Optionally filter by file type
+        Download an object with boto3's managed transfer
+
+        Large objects are fetched as concurrent ranged GETs by s3transfer's
+        native multipart machinery and written to a temporary file that is
+        renamed into place once complete.
+
+        Args:
+            bucket (str): Bucket name
+            key (str): Object key
+            filename (str or Path): Local path to write to
+            callback (callable, optional): Called with the number of bytes
+                transferred since the previous call
+            max_concurrency (int): Maximum number of concurrent part requests
+            multipart_threshold (int): Size in bytes above which multipart is used
+            multipart_chunksize (int): Size in bytes of each part
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max(1, max_concurrency)
+        )
+        self.client.download_file(bucket, key, str(filename), Config=config, Callback=callback)
+
+    def _collect_objects(self, bucket, contents, file_type, s3_objects, file_types):
+        """
+        Append the objects of one listing page to s3_objects
+
+        Per-extension counts and sizes are accumulated in the same pass, so
+        summaries don't need another walk over the objects.
+
+        Args:
+            bucket (str): Bucket name
+            contents (list): 'Contents' entries of a list_objects_v2 page
+            file_type (str, optional): Lower-cased file extension to filter by (e.g. '.csv')
+            s3_objects (list): List the matching objects are appended to
+            file_types (defaultdict): Maps extension to [count, size]; updated in place
+        """
+        # Objects build their download URL from this on demand
+        base_url = f"{self.ENDPOINT_URL}/{bucket}"
+
+        for obj in contents:
+            # Same text as strftime('%Y-%m-%d %H:%M:%S'), without the locale-aware
+            # format parsing; dropping botocore's UTC tzinfo leaves out the offset
+            last_modified = obj['LastModified'].replace(tzinfo=None).isoformat(' ', 'seconds')
+            size = obj['Size']
+            key = obj['Key']
+
+            # Extract file extension: the last dot in the file name, unless it
+            # is the leading dot of a hidden file. Names starting with dots are
+            # rare, so os.path.splitext only handles those
+            dot = key.rfind('.')
+            slash = key.rfind('/')
+            if dot <= slash + 1:
+                obj_ext = ''
+            elif key[slash + 1] == '.':
+                obj_ext = os.path.splitext(key)[1].lower()
+            else:
+                obj_ext = key[dot:].lower()
+
+            # Skip if file type filter is provided and doesn't match
+            if file_type and file_type != obj_ext:
+                continue
+
+            # Add to objects list
+            s3_objects.append(S3Object(last_modified, size, key, obj_ext, base_url, obj.get('ETag')))
+
+            # Update file type statistics
+            stats = file_types[obj_ext or "(no extension)"]
+            stats[0] += 1
+            stats[1] += size
+
+    def _list_params(self, bucket, prefix):
+        """
+        Build the list_objects_v2 paginator arguments shared by every listing
+
+        Pages are requested at the maximum size, and owner information,
+        which is never used, is left out of the responses.
+
+        Args:
+            bucket (str): Bucket name
+            prefix (str): Key prefix to list
+
+        Returns:
+            dict: Keyword arguments for paginate()
+        """
+        return {
+            'Bucket': bucket,
+            'Prefix': prefix,
+            'FetchOwner': False,
+            'PaginationConfig': {'PageSize': self.LIST_PAGE_SIZE},
+        }
+
+    def _list_prefix(self, bucket, prefix, file_type=None):
+        """
+        List every object under a prefix, one page after another
+
+        Args:
+            bucket (str): Bucket name
+            prefix (str): Key prefix to list
+            file_type (str, optional): File extension to filter by (e.g. '.csv')
+
+        Returns:
+            tuple: (s3_objects, file_types) as accumulated by _collect_objects
+        """
+        s3_objects = []
+        file_types = defaultdict(lambda: [0, 0])
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(**self._list_params(bucket, prefix)):
+            self._collect_objects(bucket, page.get('Contents', []), file_type, s3_objects, file_types)
+        return s3_objects, file_types
+
+    def _list_objects(self, s3_url, file_type=None, max_workers=None):
+        """
+        List objects and per-extension statistics, listing sub-prefixes concurrently
 
         Args:
             s3_url (str): S3 URL in the format s3://bucket/prefix
             file_type (str, optional): File extension to filter by (e.g. '.csv')
+            max_workers (int, optional): Number of sub-prefixes listed at once
 
         Returns:
-            list: List of S3 objects with metadata
+            tuple: (s3_objects, file_types) where file_types maps extension to [count, size]
         """
         bucket, prefix = self.parse_s3_url(s3_url)
+        max_workers = max_workers or self.LIST_MAX_WORKERS
+
+        # Normalize the filter once rather than for every object
+        file_type = file_type.lower() if file_type else None
+
+        if max_workers <= 1:
+            return self._list_prefix(bucket, prefix, file_type)
+
+        # List one level deep: objects directly under the prefix, plus the
+        # sub-prefixes that hold everything else. A level with a single
+        # sub-prefix leaves nothing to split between workers (as with a
+        # repository prefix without its trailing slash), so keep descending
         s3_objects = []
+        file_types = defaultdict(lambda: [0, 0])
+        paginator = self.client.get_paginator('list_objects_v2')
+        level = prefix
+        while True:
+            sub_prefixes = []
+            for page in paginator.paginate(Delimiter='/', **self._list_params(bucket, level)):
+                self._collect_objects(bucket, page.get('Contents', []), file_type, s3_objects, file_types)
+                sub_prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+            if len(sub_prefixes) != 1:
+                break
+            level = sub_prefixes[0]
+
+        # Paginate the sub-prefixes concurrently, merging their statistics
+        if sub_prefixes:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(sub_prefixes))) as executor:
+                listings = executor.map(lambda p: self._list_prefix(bucket, p, file_type), sub_prefixes)
+                for chunk, chunk_types in listings:
+                    s3_objects.extend(chunk)
+                    for ext, (count, size) in chunk_types.items():
+                        stats = file_types[ext]
+                        stats[0] += count
+                        stats[1] += size
+
+        # Each level and each sub-prefix listing is already in key order, so
+        # this sort only merges those runs back into the order of a flat listing
+        s3_objects.sort(key=attrgetter('key'))
+        return s3_objects, file_types
+
+    def list_objects(self, s3_url, file_type=None, max_workers=None):
+        """
+        List objects from an S3-compatible storage
+        Optionally filter by file type
 
-        try:
-            # Initialize pagination
-            paginator = self.client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(
-                Bucket=bucket,
-                Prefix=prefix
-            )
-
-            # Process each page of results
-            for page in page_iterator:
-                # Process each object in the page
-                for obj in page.get('Contents', []):
-                    last_modified = obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S')
-                    size = obj['Size']
-                    key = obj['Key']
-
-                    # Generate a direct URL for the object
-                    download_url = f"{self.ENDPOINT_URL}/{bucket}/{key}"
-
-                    # Extract file extension
-                    obj_ext = os.path.splitext(key)[-1].lower()
-
-                    # Skip if file type filter is provided and doesn't match
-                    if file_type and file_type.lower() != obj_ext:
-                        continue
-
-                    # Add to objects list
-                    s3_objects.append({
-                        'last_modified': last_modified,
-                        'size': size,
-                        'key': key,
-                        'download_url': download_url,
-                        'extension': obj_ext
-                    })
-
-            return s3_objects
+        The prefix is first listed one level deep, descending further while
+        a level holds a single sub-prefix; the sub-prefixes found there are
+        then paginated concurrently, so listings spread over several
+        directories don't wait on one round trip after another.
+
+        Args:
+            s3_url (str): S3 URL in the format s3://bucket/prefix
+            file_type (str, optional): File extension to filter by (e.g. '.csv')
+            max_workers (int, optional): Number of sub-prefixes listed at once
+                (defaults to LIST_MAX_WORKERS; 1 lists everything serially)
 
+        Returns:
+            list: List of S3Object instances
+        """
+        try:
+            return self._list_objects(s3_url, file_type, max_workers)[0]
         except Exception as e:
-            logger.error(f"Error listing S3 objects: {e}")
+            logger.error("Error listing S3 objects: %s", e)
             return []
 
+    def _build_summary(self, total_files, file_types):
+        """
+        Build summary statistics from per-extension counts and sizes
+
+        Args:
+            total_files (int): Number of objects
+            file_types (dict): Maps extension to [count, size]
+
+        Returns:
+            dict: Summary statistics including file count and total size
+        """
+        total_size = sum(size for _, size in file_types.values())
+        return {
+            'total_files': total_files,
+            'total_size': total_size,
+            'total_size_human': self.human_readable_size(total_size),
+            'file_types': {ext: {'count': count, 'size': size} for ext, (count, size) in file_types.items()}
+        }
+
     def get_summary(self, s3_objects):
         """
         Generate summary statistics for a list of S3 objects
@@ -208,31 +497,25 @@ class SourceCoopS3:
         Returns:
             dict: Summary statistics including file count and total size
         """
-        # Initialize counters for summary
-        total_files = len(s3_objects)
-        total_size = sum(obj['size'] for obj in s3_objects)
-        file_types = defaultdict(lambda: {'count': 0, 'size': 0})
+        file_types = defaultdict(lambda: [0, 0])
 
         # Process each object
         for obj in s3_objects:
             # Update file type statistics
-            file_ext = obj['extension'] if obj['extension'] else "(no extension)"
-            file_types[file_ext]['count'] += 1
-            file_types[file_ext]['size'] += obj['size']
+            stats = file_types[obj.extension or "(no extension)"]
+            stats[0] += 1
+            stats[1] += obj.size
 
-        # Create summary statistics
-        return {
-            'total_files': total_files,
-            'total_size': total_size,
-            'total_size_human': self.human_readable_size(total_size),
-            'file_types': dict(file_types)
-        }
+        return self._build_summary(len(s3_objects), file_types)
 
     def list_objects_with_summary(self, s3_url, file_type=None):
         """
         List objects from an S3-compatible storage and generate summary statistics
         Optionally filter by file type
 
+        The statistics are accumulated while the listing is built, so the
+        objects are only walked once.
+
         Args:
             s3_url (str): S3 URL in the format s3://bucket/prefix
             file_type (str, optional): File extension to filter by (e.g. '.csv')
@@ -242,6 +525,10 @@ class SourceCoopS3:
                 s3_objects (list): List of S3 objects
                 summary (dict): Summary statistics including file count and total size
         """
-        s3_objects = self.list_objects(s3_url, file_type)
-        summary = self.get_summary(s3_objects)
-        return s3_objects, summary
+        try:
+            s3_objects, file_types = self._list_objects(s3_url, file_type)
+        except Exception as e:
+            logger.error("Error listing S3 objects: %s", e)
+            s3_objects, file_types = [], {}
+
+        return s3_objects, self._build_summary(len(s3_objects), file_types)